@@ -1,13 +1,10 @@
 from __future__ import annotations
 
-import abc
-import builtins
 import dataclasses
+import functools
 import inspect
 import re
 import sys
-import threading
-import traceback
 import types
 import typing
 import weakref
@@ -16,84 +13,159 @@ type Instance = object
 type Name = typing.Annotated[str, annotated_types.Predicate(str.isidentifier)]  # noqa
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Raise:
     exc_type: type[BaseException]
     exc_val: BaseException
     exc_tb: types.TracebackType
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
-class Register(abc.ABC):
+class InstanceDict[Value](dict[int, Value]):
+    """Values keyed by `id(instance)` for as long as the instance is alive.
+
+    Lookups are a plain `dict.get(id(instance))`, with none of `weakref.WeakKeyDictionary`'s per-lookup weak reference.
+    """
+
+    def setdefault_instance(self, instance: Instance, value: Value) -> Value:
+        # `dict.setdefault` is atomic, so racing first accesses all get the same value without a lock. The losers'
+        #  values are discarded.
+        if (value_ := self.setdefault(id(instance), value)) is value:
+            try:
+                weakref.finalize(instance, self.pop, id(instance), None)
+            except TypeError:
+                # Not weakly referenceable. Nothing would ever remove the entry, and the value may hold the instance.
+                del self[id(instance)]
+                raise
+        return value_
+
+
+@functools.cache
+def field_names(cls: type) -> tuple[str, ...]:
+    return tuple(field.name for field in dataclasses.fields(cls))
+
+
+def replace[T](obj: T, /, **changes: typing.Any) -> T:
+    """`dataclasses.replace` without the call to `__init__`.
+
+    Field values are copied straight onto a new object, so `__post_init__` doesn't run and `init=False` fields are
+    copied rather than recomputed. Use `dataclasses.replace` for classes that depend on either.
+    """
+    new = object.__new__(type(obj))
+    for name in field_names(type(obj)):
+        object.__setattr__(new, name, changes[name] if name in changes else getattr(obj, name))
+    return new
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class Register:
     class Key(tuple[str, ...]):
+        __slots__ = ()
+
+        # Qualname components that can't be reached by attribute access, e.g. `.<locals>` and `.<lambda>`.
+        unreachable_pattern: typing.ClassVar[re.Pattern[str]] = re.compile(r'\.<[^>]*>')
+
         def __str__(self) -> str:
             return '.'.join(self)
 
-    decorateds: dict[Key, Decorated] = dataclasses.field(default_factory=dict)
+        @classmethod
+        def of_name(cls, name: str) -> Register.Key:
+            if '<' in name:
+                name = cls.unreachable_pattern.sub('', name)
+            return cls(name.split('.'))
+
+    # Weak by default so that registering doesn't keep decorateds (and whatever state their contexts hold, e.g. cached
+    #  results) alive after the user drops them.
+    decorateds: typing.MutableMapping[Key, Decorated] = dataclasses.field(default_factory=weakref.WeakValueDictionary)
     links: dict[Key, set[Name]] = dataclasses.field(default_factory=dict)
 
 
-@typing.runtime_checkable
 class Decoratee[** Params, Return](typing.Protocol):
     def __call__(*args: Params.args, **kwargs: Params.kwargs) -> typing.Awaitable[Return] | Return: ...
 
 
-@typing.runtime_checkable
 class AsyncDecoratee[** Params, Return](typing.Protocol):
     async def __call__(*args: Params.args, **kwargs: Params.kwargs) -> Return: ...
 
 
-@typing.runtime_checkable
 class MultiDecoratee[** Params, Return](typing.Protocol):
     def __call__(*args: Params.args, **kwargs: Params.kwargs) -> Return: ...
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
-class ContextBase[** Params, Return](
-    abc.ABC
-):
-    enter_context_by_instance: weakref.WeakKeyDictionary[
-        Instance, EnterContextBase[Params, Return]
-    ] = dataclasses.field(default_factory=weakref.WeakKeyDictionary)
+class ContextT:
+    """Class attribute resolving to the context class named `name` in the module that defines the owner.
+
+    Every decorator module defines its own AsyncEnterContext, MultiExitContext, etc. The first lookup on a class
+    replaces this descriptor on that class with the resolved class, so later lookups are plain class attribute loads.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __set_name__(self, owner: type, attr: str) -> None:
+        self.attr = attr
+
+    def __get__(self, instance: ContextBase | None, owner: type[ContextBase]) -> type[ContextBase]:
+        context_t = getattr(sys.modules[owner.__module__], self.name)
+        setattr(owner, self.attr, context_t)
+        return context_t
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class ContextBase[** Params, Return]:
     instance: Instance | None = None
-    instance_lock: threading.Lock = dataclasses.field(default_factory=threading.Lock)
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super(ContextBase, cls).__init_subclass__(**kwargs)
+        # A subclass may live in a different module than a class whose `ContextT` has already been resolved. Give it
+        #  its own unresolved `ContextT` so it finds its own module's context classes.
+        for attr in ['async_context_t', 'enter_context_t', 'exit_context_t', 'multi_context_t']:
+            if attr in cls.__dict__:
+                continue
+            for base in cls.__mro__[1:]:
+                if attr in base.__dict__:
+                    match base.__dict__[attr]:
+                        case ContextT(name=name) | type(__name__=name, __module__=base.__module__):
+                            setattr(cls, attr, ContextT(name))
+                            cls.__dict__[attr].__set_name__(cls, attr)
+                    break
 
     @property
-    @abc.abstractmethod
-    def async_context_t(self) -> type[AsyncContext[Params, Return]]: ...
+    def async_context_t(self) -> type[AsyncContext[Params, Return]]:
+        raise NotImplementedError
 
     @property
-    @abc.abstractmethod
-    def multi_context_t(self) -> type[MultiContext[Params, Return]]: ...
+    def multi_context_t(self) -> type[MultiContext[Params, Return]]:
+        raise NotImplementedError
 
     @property
-    @abc.abstractmethod
-    def enter_context_t(self) -> type[EnterContext[Params, Return]]: ...
+    def enter_context_t(self) -> type[EnterContext[Params, Return]]:
+        raise NotImplementedError
 
     @property
-    @abc.abstractmethod
-    def exit_context_t(self) -> type[ExitContext[Params, Return]]: ...
+    def exit_context_t(self) -> type[ExitContext[Params, Return]]:
+        raise NotImplementedError
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class AsyncContextBase[** Params, Return](
     ContextBase[Params, Return],
-    abc.ABC,
 ): ...
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class MultiContextBase[** Params, Return](
     ContextBase[Params, Return],
-    abc.ABC,
 ): ...
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class EnterContextBase[** Params, Return](
     ContextBase[Params, Return],
-    abc.ABC,
 ):
+    # Only enter contexts are bound to instances. Exit contexts are created on every call and shouldn't pay for these.
+    enter_context_by_instance: InstanceDict[EnterContextBase[Params, Return]] = dataclasses.field(
+        default_factory=InstanceDict
+    )
     next_enter_context: EnterContextBase[Params, Return] | Base[Params, Return]
 
     @typing.overload
@@ -110,20 +182,18 @@ class EnterContextBase[** Params, Return](
         **kwargs: Params.kwargs,
     ) -> MultiExitContextBase[Params, Return]: ...
 
-    @abc.abstractmethod
-    def __call__(self, *args, **kwargs): ...
+    def __call__(self, *args, **kwargs):
+        raise NotImplementedError
 
     def __get__(self, instance: Instance, owner) -> EnterContextBase[Params, Return]:
-        with self.instance_lock:
-            if (enter_context := self.enter_context_by_instance.get(instance)) is None:
-                enter_context = self.enter_context_by_instance[instance] = dataclasses.replace(self, instance=instance)
+        if (enter_context := self.enter_context_by_instance.get(id(instance))) is not None:
             return enter_context
+        return self.enter_context_by_instance.setdefault_instance(instance, replace(self, instance=instance))
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class ExitContextBase[** Params, Return](
     ContextBase[Params, Return],
-    abc.ABC,
 ):
     @typing.overload
     async def __call__(self: AsyncExitContextBase[Params, Return], return_: Raise | Return) -> None:
@@ -133,216 +203,166 @@ class ExitContextBase[** Params, Return](
     def __call__(self: MultiExitContextBase[Params, Return], return_: Raise | Return) -> None:
         ...
 
-    @abc.abstractmethod
-    def __call__(self, return_): ...
+    def __call__(self, return_):
+        raise NotImplementedError
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class AsyncEnterContextBase[** Params, Return](
     AsyncContextBase[Params, Return],
     EnterContextBase[Params, Return],
-    abc.ABC,
 ): ...
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class MultiEnterContextBase[** Params, Return](
     MultiContextBase[Params, Return],
     EnterContextBase[Params, Return],
-    abc.ABC,
 ): ...
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class AsyncExitContextBase[** Params, Return](
     AsyncContextBase[Params, Return],
     ExitContextBase[Params, Return],
-    abc.ABC,
 ): ...
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class MultiExitContextBase[** Params, Return](
     MultiContextBase[Params, Return],
     ExitContextBase[Params, Return],
-    abc.ABC,
 ): ...
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
-class ContextMixin[** Params, Return](
-    abc.ABC,
-): ...
-
-
-@dataclasses.dataclass(frozen=True, kw_only=True)
-class AsyncContextMixin[** Params, Return](
-    abc.ABC,
-):
-
-    @property
-    def enter_context_t(self) -> type[AsyncEnterContext[Params, Return]]:
-        return inspect.getmodule(self).AsyncEnterContext
-
-    @property
-    def exit_context_t(self) -> type[AsyncExitContext[Params, Return]]:
-        return inspect.getmodule(self).AsyncExitContext
-
-
-@dataclasses.dataclass(frozen=True, kw_only=True)
-class MultiContextMixin[** Params, Return](
-    abc.ABC,
-):
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class ContextMixin[** Params, Return]: ...
 
-    @property
-    def enter_context_t(self) -> type[MultiEnterContext[Params, Return]]:
-        return inspect.getmodule(self).MultiEnterContext
-
-    @property
-    def exit_context_t(self) -> type[MultiExitContext[Params, Return]]:
-        return inspect.getmodule(self).MultiExitContext
 
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class AsyncContextMixin[** Params, Return]:
+    enter_context_t = ContextT('AsyncEnterContext')
+    exit_context_t = ContextT('AsyncExitContext')
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
-class EnterContextMixin[** Params, Return](
-    abc.ABC,
-):
 
-    @property
-    def async_context_t(self) -> type[AsyncEnterContext[Params, Return]]:
-        return inspect.getmodule(self).AsyncEnterContext
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class MultiContextMixin[** Params, Return]:
+    enter_context_t = ContextT('MultiEnterContext')
+    exit_context_t = ContextT('MultiExitContext')
 
-    @property
-    def multi_context_t(self) -> type[MultiEnterContext[Params, Return]]:
-        return inspect.getmodule(self).MultiEnterContext
 
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class EnterContextMixin[** Params, Return]:
+    async_context_t = ContextT('AsyncEnterContext')
+    multi_context_t = ContextT('MultiEnterContext')
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
-class ExitContextMixin[** Params, Return](
-    abc.ABC,
-):
-    @property
-    def async_context_t(self) -> type[AsyncExitContext[Params, Return]]:
-        return inspect.getmodule(self).AsyncExitContext
 
-    @property
-    def multi_context_t(self) -> type[MultiExitContext[Params, Return]]:
-        return inspect.getmodule(self).MultiExitContext
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class ExitContextMixin[** Params, Return]:
+    async_context_t = ContextT('AsyncExitContext')
+    multi_context_t = ContextT('MultiExitContext')
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class Context[** Params, Return](
     ContextMixin[Params, Return],
     ContextBase[Params, Return],
-    abc.ABC,
 ): ...
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class AsyncContext[** Params, Return](
     AsyncContextMixin[Params, Return],
     AsyncContextBase[Params, Return],
-    abc.ABC,
 ): ...
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class MultiContext[** Params, Return](
     MultiContextMixin[Params, Return],
     MultiContextBase[Params, Return],
-    abc.ABC,
 ): ...
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class EnterContext[** Params, Return](
     EnterContextMixin[Params, Return],
     EnterContextBase[Params, Return],
-    abc.ABC,
 ): ...
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class ExitContext[** Params, Return](
     ExitContextMixin[Params, Return],
     ExitContextBase[Params, Return],
-    abc.ABC,
 ): ...
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class AsyncEnterContextMixin[** Params, Return](
     AsyncContextMixin[Params, Return],
     EnterContextMixin[Params, Return],
-    abc.ABC,
 ): ...
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class MultiEnterContextMixin[** Params, Return](
     MultiContextMixin[Params, Return],
     EnterContextMixin[Params, Return],
-    abc.ABC,
 ): ...
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class AsyncExitContextMixin[** Params, Return](
     AsyncContextMixin[Params, Return],
     ExitContextMixin[Params, Return],
-    abc.ABC,
 ): ...
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class MultiExitContextMixin[** Params, Return](
     MultiContextMixin[Params, Return],
     ExitContextMixin[Params, Return],
-    abc.ABC,
 ): ...
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class AsyncEnterContext[** Params, Return](
     AsyncEnterContextMixin[Params, Return],
     AsyncContext[Params, Return],
     EnterContext[Params, Return],
     AsyncEnterContextBase[Params, Return],
-    abc.ABC,
 ): ...
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class MultiEnterContext[** Params, Return](
     MultiEnterContextMixin[Params, Return],
     MultiContext[Params, Return],
     EnterContext[Params, Return],
     MultiEnterContextBase[Params, Return],
-    abc.ABC,
 ): ...
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class AsyncExitContext[** Params, Return](
     AsyncExitContextMixin[Params, Return],
     AsyncContext[Params, Return],
     ExitContext[Params, Return],
     AsyncExitContextBase[Params, Return],
-    abc.ABC,
 ): ...
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class MultiExitContext[** Params, Return](
     MultiExitContextMixin[Params, Return],
     MultiContext[Params, Return],
     ExitContext[Params, Return],
     MultiExitContextBase[Params, Return],
-    abc.ABC,
 ): ...
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class Base[** Params, Return]:
     decoratee: Decoratee[Params, Return]
 
@@ -351,16 +371,16 @@ class Base[** Params, Return]:
 
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
-class Decorated[** Params, Return](abc.ABC):
+class Decorated[** Params, Return]:
     enter_context: EnterContext[Params, Return] | Base[Params, Return]
-    decorated_by_instance: weakref.WeakKeyDictionary[Instance, Decorated] = dataclasses.field(
-        default_factory=weakref.WeakKeyDictionary
-    )
+    decorated_by_instance: InstanceDict[Decorated] = dataclasses.field(default_factory=InstanceDict)
+    decoratee: Decoratee[Params, Return]
     instance: Instance = ...
-    instance_lock: threading.Lock = dataclasses.field(default_factory=threading.Lock)
+    # Prepended to every call's arguments. Empty until bound by `__get__`, so the call path needs no branch on
+    #  `instance`.
+    instance_args: tuple[Instance] | tuple[()] = ()
     register_key: Register.Key
-    signature: inspect.Signature
-    __doc__: str
+    __doc__: str | None
     __module__: str
     __name__: str
     __qualname__: str
@@ -371,25 +391,31 @@ class Decorated[** Params, Return](abc.ABC):
     @typing.overload
     def __call__(self: MultiDecorated[Params, Return], *args: Params.args, **kwargs: Params.kwargs) -> Return: ...
 
-    @abc.abstractmethod
-    def __call__(self): ...
+    def __call__(self):
+        raise NotImplementedError
+
+    @functools.cached_property
+    def signature(self) -> inspect.Signature:
+        # Computed on first use. Most decorated functions never need it.
+        return inspect.signature(self.decoratee)
 
     def __get__(self, instance: Instance, owner) -> Decorated[Params, Return]:
-        with self.instance_lock:
-            if (decorated := self.decorated_by_instance.get(instance)) is None:
-                decorated = self.decorated_by_instance[instance] = dataclasses.replace(
-                    self,
-                    enter_context=self.enter_context.__get__(instance, owner),
-                    instance=instance,
-                )
+        if (decorated := self.decorated_by_instance.get(id(instance))) is not None:
             return decorated
+        return self.decorated_by_instance.setdefault_instance(instance, replace(
+            self,
+            enter_context=self.enter_context.__get__(instance, owner),
+            instance=instance,
+            instance_args=(instance,),
+        ))
 
     @staticmethod
     def norm_kwargs(kwargs: Params.kwargs) -> Params.kwargs:
-        return dict(sorted(kwargs.items()))
+        # `**kwargs` is already a fresh dict, and with fewer than two items it is already sorted.
+        return kwargs if len(kwargs) < 2 else dict(sorted(kwargs.items()))
 
     def norm_args(self, args: Params.args) -> Params.args:
-        return args if self.instance is ... else [self.instance, *args]
+        return self.instance_args + args
 
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
@@ -397,24 +423,43 @@ class AsyncDecorated[** Params, Return](Decorated[Params, Return]):
     enter_context: AsyncEnterContext[Params, Return] | Base[Params, Return]
 
     async def __call__(self, *args: Params.args, **kwargs: Params.kwargs) -> Return:
+        if type(item := self.enter_context) is Base:
+            # No contexts to enter (e.g. a CLI entrypoint). Just call through.
+            return await item.decoratee(*self.instance_args, *args, **kwargs)
+
         args, kwargs = self.norm_args(args), self.norm_kwargs(kwargs)
-        stack = [self.enter_context]
-        result: Raise | Return = ...
+        exit_contexts: list[ExitContextBase[Params, Return]] = []
 
-        while stack:
+        while True:
+            # Enter contexts until one of them returns a result or the decoratee is reached.
             try:
-                match item := stack.pop():
-                    case Base():
-                        stack.append(await item.decoratee(*args, **kwargs))
-                    case EnterContextBase():
-                        stack.append(await item(*args, **kwargs))
-                    case ContextBase(), (Base() | ContextBase()):
-                        stack += [*item]
-                    case ExitContextBase():
-                        stack.append(await item(result))
-                    case result: ...
-            except Exception:  # noqa
-                stack.append(Raise(*sys.exc_info()))
+                while True:
+                    if isinstance(item, Base):
+                        result = await item.decoratee(*args, **kwargs)
+                        break
+                    result = await item(*args, **kwargs)
+                    if type(result) is tuple and len(result) == 2 and isinstance(result[0], ContextBase):
+                        exit_context, item = result
+                        exit_contexts.append(exit_context)
+                    elif isinstance(result, (EnterContextBase, Base)):
+                        # Passed straight through to the next context (e.g. Log with logging disabled).
+                        item = result
+                    else:
+                        break
+            except Exception as exc:  # noqa
+                result = Raise(type(exc), exc, exc.__traceback__)
+
+            # Exit contexts innermost first. An exit context may return an enter context to go around again.
+            while exit_contexts:
+                try:
+                    result = await exit_contexts.pop()(result)
+                except Exception as exc:  # noqa
+                    result = Raise(type(exc), exc, exc.__traceback__)
+                if isinstance(result, EnterContextBase):
+                    item = result
+                    break
+            else:
+                break
 
         if isinstance(result, Raise):
             # TODO: there's more to be done with setting exception context
@@ -428,24 +473,43 @@ class MultiDecorated[** Params, Return](Decorated[Params, Return]):
     enter_context: MultiEnterContextBase[Params, Return] | Base[Params, Return]
 
     def __call__(self, *args: Params.args, **kwargs: Params.kwargs) -> Return:
+        if type(item := self.enter_context) is Base:
+            # No contexts to enter (e.g. a CLI entrypoint). Just call through.
+            return item.decoratee(*self.instance_args, *args, **kwargs)
+
         args, kwargs = self.norm_args(args), self.norm_kwargs(kwargs)
-        stack = [self.enter_context]
-        result: Raise | Return = ...
+        exit_contexts: list[ExitContextBase[Params, Return]] = []
 
-        while stack:
+        while True:
+            # Enter contexts until one of them returns a result or the decoratee is reached.
             try:
-                match item := stack.pop():
-                    case Base():
-                        stack.append(item.decoratee(*args, **kwargs))
-                    case EnterContextBase():
-                        stack.append(item(*args, **kwargs))
-                    case ContextBase(), (Base() | ContextBase()):
-                        stack += [*item]
-                    case ExitContextBase():
-                        stack.append(item(result))
-                    case result: ...
-            except Exception:  # noqa
-                stack.append(Raise(*sys.exc_info()))
+                while True:
+                    if isinstance(item, Base):
+                        result = item.decoratee(*args, **kwargs)
+                        break
+                    result = item(*args, **kwargs)
+                    if type(result) is tuple and len(result) == 2 and isinstance(result[0], ContextBase):
+                        exit_context, item = result
+                        exit_contexts.append(exit_context)
+                    elif isinstance(result, (EnterContextBase, Base)):
+                        # Passed straight through to the next context (e.g. Log with logging disabled).
+                        item = result
+                    else:
+                        break
+            except Exception as exc:  # noqa
+                result = Raise(type(exc), exc, exc.__traceback__)
+
+            # Exit contexts innermost first. An exit context may return an enter context to go around again.
+            while exit_contexts:
+                try:
+                    result = exit_contexts.pop()(result)
+                except Exception as exc:  # noqa
+                    result = Raise(type(exc), exc, exc.__traceback__)
+                if isinstance(result, EnterContextBase):
+                    item = result
+                    break
+            else:
+                break
 
         if isinstance(result, Raise):
             # TODO: there's more to be done with setting exception context
@@ -454,7 +518,7 @@ class MultiDecorated[** Params, Return](Decorated[Params, Return]):
         return result
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class Decorator[** Params, Return]:
     register: typing.ClassVar[Register] = Register()
 
@@ -466,27 +530,33 @@ class Decorator[** Params, Return]:
         if isinstance(decoratee, Decorated):
             return decoratee
 
-        register_key = Register.Key([
-            *re.sub(r'.<.*>', '', '.'.join([decoratee.__module__, decoratee.__qualname__])).split('.')
-        ])
+        register_key = Register.Key.of_name(f'{decoratee.__module__}.{decoratee.__qualname__}')
 
-        for i in range(len(register_key)):
-            self.register.links.setdefault(Register.Key(register_key[:i]), set()).add(register_key[i])
         self.register.links.setdefault(register_key, set())
-
-        if inspect.iscoroutinefunction(decoratee):
-            decorated_t = AsyncDecorated
-        else:
-            decorated_t = MultiDecorated
+        # Link from the longest prefix down. Once a prefix already links to the next name, every shorter prefix is linked
+        #  too, so decorating the second function in a module only touches its own module's entry.
+        for i in reversed(range(len(register_key))):
+            if register_key[i] in (names := self.register.links.setdefault(Register.Key(register_key[:i]), set())):
+                break
+            names.add(register_key[i])
+
+        match decoratee:
+            case types.FunctionType(__code__=code) if code.co_flags & inspect.CO_COROUTINE:
+                decorated_t = AsyncDecorated
+            # Anything else (partials, bound methods, `inspect.markcoroutinefunction`) needs the full check.
+            case _ if inspect.iscoroutinefunction(decoratee):
+                decorated_t = AsyncDecorated
+            case _:
+                decorated_t = MultiDecorated
 
         decorated = self.register.decorateds[register_key] = decorated_t(
+                decoratee=decoratee,
                 enter_context=Base(decoratee=decoratee),
                 register_key=register_key,
-                signature=inspect.signature(decoratee),
-                __doc__=str(decoratee.__doc__),
-                __module__=str(decoratee.__module__),
-                __name__=str(decoratee.__name__),
-                __qualname__=str(decoratee.__qualname__),
+                __doc__=decoratee.__doc__,
+                __module__=decoratee.__module__,
+                __name__=decoratee.__name__,
+                __qualname__=decoratee.__qualname__,
         )
 
         return decorated
@@ -45,15 +45,12 @@ from __future__ import annotations
 import annotated_types
 import argparse
 import ast
-import asyncio
 import builtins
 import dataclasses
 import enum
+import functools
 import inspect
-import itertools
 import logging
-import pprint
-import re
 import sys
 import types
 import typing
@@ -71,55 +68,108 @@ class ParseOne[T]:
 
     type _Arg = bool | float | int | str | list | dict | set | None
 
-    def _parse_arg(self, arg: _Arg, /) -> T:
+    @functools.cached_property
+    def _parse_arg(self) -> typing.Callable[[_Arg], T]:
+        """A parser specialized to `t`, so matching on `t` happens once per ParseOne rather than once per arg."""
+
         match self.t if (origin := typing.get_origin(self.t)) is None else (origin, typing.get_args(self.t)):
             case types.NoneType | None:
-                assert arg is None, f'{self} expected `None`, got `{arg}`.'
+                def _parse_arg(arg: ParseOne._Arg, /) -> T:
+                    assert arg is None, f'{self} expected `None`, got `{arg}`.'
+                    return arg
             case builtins.bool | builtins.int | builtins.float | builtins.str:
-                assert isinstance(arg, self.t), f'{self} expected `{self.t}`, got `{arg}`'
+                def _parse_arg(arg: ParseOne._Arg, /) -> T:
+                    assert isinstance(arg, self.t), f'{self} expected `{self.t}`, got `{arg}`'
+                    return arg
             case (builtins.frozenset | builtins.list | builtins.set), (Value,):
-                assert isinstance(arg, (list, set))
-                arg = origin([ParseOne(t=Value)._parse_arg(value) for value in arg])
+                parse_value = ParseOne(t=Value)._parse_arg
+
+                def _parse_arg(arg: ParseOne._Arg, /) -> T:
+                    assert isinstance(arg, (list, set))
+                    return origin([parse_value(value) for value in arg])
             case builtins.dict, (Key, Value):
-                assert isinstance(arg, dict)
-                arg = {
-                    ParseOne(t=Key)._parse_arg(key): ParseOne(t=Value)._parse_arg(value) for key, value in arg.items()
-                }
+                parse_key, parse_value = ParseOne(t=Key)._parse_arg, ParseOne(t=Value)._parse_arg
+
+                def _parse_arg(arg: ParseOne._Arg, /) -> T:
+                    assert isinstance(arg, dict)
+                    return {parse_key(key): parse_value(value) for key, value in arg.items()}
 
             case builtins.tuple, ():
-                assert arg == tuple()
+                def _parse_arg(arg: ParseOne._Arg, /) -> T:
+                    assert arg == tuple()
+                    return arg
             case builtins.tuple, (Value,):
-                assert isinstance(arg, tuple) and len(arg) == 1
-                arg = tuple([ParseOne(t=Value)._parse_arg(arg[0])])
+                parse_value = ParseOne(t=Value)._parse_arg
+
+                def _parse_arg(arg: ParseOne._Arg, /) -> T:
+                    assert isinstance(arg, tuple) and len(arg) == 1
+                    return tuple([parse_value(arg[0])])
             case builtins.tuple, (Value, builtins.Ellipsis):
-                assert isinstance(arg, tuple)
-                arg = tuple([ParseOne(t=Value)._parse_arg(value) for value in arg])
+                parse_value = ParseOne(t=Value)._parse_arg
+
+                def _parse_arg(arg: ParseOne._Arg, /) -> T:
+                    assert isinstance(arg, tuple)
+                    return tuple([parse_value(value) for value in arg])
             case builtins.tuple, (Value, *Values):
-                assert isinstance(arg, tuple) and len(arg) > 0
-                arg = (ParseOne(t=Value)._parse_arg(arg[0]), *ParseOne(t=tuple[*Values])._parse_arg(arg[1:]))
+                parse_value, parse_values = ParseOne(t=Value)._parse_arg, ParseOne(t=tuple[*Values])._parse_arg
+
+                def _parse_arg(arg: ParseOne._Arg, /) -> T:
+                    assert isinstance(arg, tuple) and len(arg) > 0
+                    return parse_value(arg[0]), *parse_values(arg[1:])
 
             case (typing.Union | types.UnionType), Values:
-                assert type(arg) in Values
+                def _parse_arg(arg: ParseOne._Arg, /) -> T:
+                    assert type(arg) in Values
+                    return arg
             case typing.Literal, Values:
-                assert arg in Values
+                def _parse_arg(arg: ParseOne._Arg, /) -> T:
+                    assert arg in Values
+                    return arg
 
             case (Value, _) | Value if issubclass(Value, enum.Enum):
-                assert isinstance(arg, str) and hasattr(Value, arg)
-                arg = getattr(Value, arg)
+                def _parse_arg(arg: ParseOne._Arg, /) -> T:
+                    assert isinstance(arg, str) and hasattr(Value, arg)
+                    return getattr(Value, arg)
 
             case (Value, _) | Value:
-                arg = Value(arg)
+                _parse_arg = Value
 
-        return arg
+        return _parse_arg
 
-    def parse_arg(self, arg: str, /) -> T:
-        """Returns a T parsed from given arg or throws an _Exception upon failure."""
+    @functools.cached_property
+    def _eval_arg(self) -> typing.Callable[[str], _Arg]:
+        """Evaluates a raw arg as a python literal, skipping `ast.literal_eval` for plain scalars of type `t`.
+
+        The fast paths only take args that `ast.literal_eval` would evaluate to the same value, so e.g. '42' is still an
+        int and fails to parse as a float.
+        """
 
-        if self.t != str:
+        def literal_eval(arg: str, /) -> ParseOne._Arg:
             try:
-                arg: ParseOne._Arg = ast.literal_eval(arg)
+                return ast.literal_eval(arg)
             except (SyntaxError, ValueError,):
-                pass
+                return arg
+
+        match self.t:
+            case builtins.str:
+                return lambda arg: arg
+            case builtins.bool:
+                bools = {'True': True, 'False': False}
+                return lambda arg: bools[arg] if arg in bools else literal_eval(arg)
+            case builtins.int:
+                return lambda arg: int(arg) if arg.isascii() and arg.isdigit() and arg[0] != '0' else literal_eval(arg)
+            case builtins.float:
+                return lambda arg: (
+                    float(arg) if '.' in arg and arg.isascii() and arg.replace('.', '', 1).isdigit()
+                    else literal_eval(arg)
+                )
+            case _:
+                return literal_eval
+
+    def parse_arg(self, arg: str, /) -> T:
+        """Returns a T parsed from given arg or throws an _Exception upon failure."""
+
+        arg: ParseOne._Arg = self._eval_arg(arg)
 
         try:
             value = self._parse_arg(arg)
@@ -162,6 +212,11 @@ class _AddArgument[T]:
     required: bool = ...
     type: typing.Callable[[str], T] = ...
 
+    def given_items(self) -> dict[str, typing.Any]:
+        """Returns the fields that are not `Ellipses`, keyed by name."""
+
+        return {name: value for name in _base.field_names(type(self)) if (value := getattr(self, name)) is not ...}
+
     @staticmethod
     def of_parameter(parameter: inspect.Parameter, /) -> _AddArgument[T]:
         """Returns an _Annotation converted from given `parameter`.
@@ -178,7 +233,8 @@ class _AddArgument[T]:
             f' See https://peps.python.org/pep-0563/#resolving-type-hints-at-runtime.'
         )
 
-        add_argument = _AddArgument()
+        # Collect the fields and construct once at the end; only fields not given by an override are generated.
+        kwargs = {}
         t = parameter.annotation
 
         help_lines = []
@@ -186,80 +242,74 @@ class _AddArgument[T]:
             t, *args = typing.get_args(t)
             help_lines += [*filter(lambda arg: isinstance(arg, str), args)]
             for override_add_arguments in filter(lambda arg: isinstance(arg, _AddArgument), args):
-                add_argument = dataclasses.replace(
-                    add_argument,
-                    **dict(filter(
-                        lambda item: item[1] is not ...,
-                        dataclasses.asdict(override_add_arguments).items(),
-                    )),
-                )
+                kwargs.update(override_add_arguments.given_items())
 
-        if add_argument.name_or_flags is ...:
+        if 'name_or_flags' not in kwargs:
             match parameter.kind, parameter.default == parameter.empty:
                 case (
                     (parameter.POSITIONAL_ONLY, _)
                     | ((parameter.VAR_POSITIONAL | parameter.POSITIONAL_OR_KEYWORD), True)
                 ):
-                    add_argument = dataclasses.replace(add_argument, name_or_flags=[parameter.name])
+                    kwargs['name_or_flags'] = [parameter.name]
                 case (parameter.KEYWORD_ONLY, _) | (parameter.POSITIONAL_OR_KEYWORD, False):
-                    add_argument = dataclasses.replace(
-                        add_argument, name_or_flags=[f'--{parameter.name.replace('_', '-')}']
-                    )
+                    kwargs['name_or_flags'] = [f'--{parameter.name.replace('_', '-')}']
 
-        if add_argument.action is ...:
+        if 'action' not in kwargs:
             match parameter.kind:
                 case inspect.Parameter.VAR_POSITIONAL:
-                    add_argument = dataclasses.replace(add_argument, action='append')
+                    kwargs['action'] = 'append'
 
-        if add_argument.choices is ...:
+        if 'choices' not in kwargs:
             match typing.get_origin(t) or type(t):
                 case typing.Literal:
-                    add_argument = dataclasses.replace(add_argument, choices=typing.get_args(t))
+                    kwargs['choices'] = typing.get_args(t)
                 case enum.EnumType:
-                    add_argument = dataclasses.replace(add_argument, choices=tuple(t))
+                    kwargs['choices'] = tuple(t)
 
         # No automatic actions needed for 'const'.
 
-        if add_argument.default is ...:
+        if 'default' not in kwargs:
             if parameter.default != parameter.empty:
-                add_argument = dataclasses.replace(add_argument, default=parameter.default)
+                kwargs['default'] = parameter.default
 
-        if add_argument.help is ...:
-            if add_argument.default is not ...:
-                help_lines.append(f'default: {add_argument.default!r}')
-            if add_argument.choices is not ...:
+        if 'help' not in kwargs:
+            import pprint
+
+            if 'default' in kwargs:
+                help_lines.append(f'default: {kwargs['default']!r}')
+            if 'choices' in kwargs:
                 match typing.get_origin(t) or type(t):
                     case enum.EnumType:
                         choice_names = tuple(map(lambda value: value.name, t))
                     case _:
-                        choice_names = tuple(map(str, add_argument.choices))
+                        choice_names = tuple(map(str, kwargs['choices']))
                 show_choice_names = tuple(filter(lambda choice_name: not choice_name.startswith('_'), choice_names))
                 help_lines.append(
                     f'choices: {pprint.pformat(show_choice_names, compact=True, width=60)}'
                 )
             help_lines.append(f'type: {typing.Literal if typing.get_origin(t) is typing.Literal else t!r}')
-            add_argument = dataclasses.replace(add_argument, help='\n'.join(help_lines))
+            kwargs['help'] = '\n'.join(help_lines)
 
-        if add_argument.metavar is ...:
-            if add_argument.choices is not ...:
-                add_argument = dataclasses.replace(add_argument, metavar=f'{{{parameter.name}}}')
+        if 'metavar' not in kwargs:
+            if 'choices' in kwargs:
+                kwargs['metavar'] = f'{{{parameter.name}}}'
 
-        if add_argument.nargs is ...:
-            match add_argument.action, parameter.kind, parameter.default == parameter.empty:
+        if 'nargs' not in kwargs:
+            match kwargs.get('action', ...), parameter.kind, parameter.default == parameter.empty:
                 case builtins.Ellipsis, (parameter.POSITIONAL_ONLY | parameter.POSITIONAL_OR_KEYWORD), False:
-                    add_argument = dataclasses.replace(add_argument, nargs='?')
+                    kwargs['nargs'] = '?'
                 case 'append', (parameter.VAR_POSITIONAL | parameter.VAR_KEYWORD), True:
-                    add_argument = dataclasses.replace(add_argument, nargs='*')
+                    kwargs['nargs'] = '*'
 
-        if add_argument.required is ...:
+        if 'required' not in kwargs:
             if (parameter.kind == parameter.KEYWORD_ONLY) and (parameter.default == parameter.empty):
-                add_argument = dataclasses.replace(add_argument, required=True)
+                kwargs['required'] = True
 
-        if add_argument.type is ...:
-            if add_argument.action not in {'count', 'store_false', 'store_true'}:
-                add_argument = dataclasses.replace(add_argument, type=lambda arg: ParseOne(t=t).parse_arg(arg))
+        if 'type' not in kwargs:
+            if kwargs.get('action', ...) not in {'count', 'store_false', 'store_true'}:
+                kwargs['type'] = ParseOne(t=t).parse_arg
 
-        return add_argument
+        return _AddArgument(**kwargs)
 
 
 # Override __init__ so that we can make `_side_effect` positional-only while instantiating.
@@ -271,6 +321,52 @@ class _SideEffect[T]:
         object.__setattr__(self, '_side_effect', _side_effect)
 
 
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class _Parameter:
+    """Everything `run` and `get_argument_parser` need from one entrypoint parameter, derived once per decoratee."""
+    name: str
+    kind: inspect._ParameterKind
+    # None for var keywords; those are added to a second parser built from the remainder args.
+    add_argument_params: dict[str, typing.Any] | None
+    parse_one: ParseOne
+    # Every `_SideEffect` annotation folded into one call, or None if there are none.
+    side_effect: typing.Callable[[typing.Any], None] | None
+
+    @staticmethod
+    def of_parameter(parameter: inspect.Parameter, /) -> _Parameter:
+        add_argument_params = None
+        if parameter.kind is not inspect.Parameter.VAR_KEYWORD:
+            add_argument_params = _AddArgument.of_parameter(parameter).given_items()
+
+        side_effects = []
+        t = parameter.annotation
+        if typing.get_origin(t) is typing.Annotated:
+            t, *annotations = typing.get_args(t)
+            for annotation in annotations:
+                match annotation:
+                    case _SideEffect(side_effect):
+                        side_effects.append(side_effect)
+
+        match side_effects:
+            case []:
+                side_effect = None
+            case [side_effect]:
+                ...
+            case _:
+                # Side effects are run for their effect (e.g. `logger.setLevel`), not chained; each sees the value.
+                def side_effect(value: typing.Any, /) -> None:
+                    for side_effect_ in side_effects:
+                        side_effect_(value)
+
+        return _Parameter(
+            name=parameter.name,
+            kind=parameter.kind,
+            add_argument_params=add_argument_params,
+            parse_one=ParseOne(t=t),
+            side_effect=side_effect,
+        )
+
+
 _LogLevelInt = typing.Annotated[int, annotated_types.Interval(ge=10, le=60)]
 _LogLevelStr = typing.Literal['CRITICAL', 'ERROR', 'WARNING', 'INFO', 'DEBUG', 'NOTSET']
 _LogLevel = _LogLevelInt | _LogLevelStr
@@ -381,7 +477,15 @@ class Decorator[** Params, Return](_base.Decorator[Params, Return]):
             generated for each submodule top-level function with name matching decorated entrypoint name.
     """
 
-    register: typing.ClassVar[_base.Register] = _base.Register()
+    # CLI returns its decorateds to the caller, but generated subcommands only live here, so hold them strongly.
+    register: typing.ClassVar[_base.Register] = _base.Register(decorateds={})
+    # Annotations may not be resolvable at decoration time, so parameters are derived on first use instead.
+    parameters_by_decoratee: typing.ClassVar[_base.InstanceDict[tuple[_Parameter, ...]]] = _base.InstanceDict()
+    # Generated for keys with no registered entrypoint, along with the subcommand names they were generated for. More
+    #  subcommands may be registered later, in which case the entrypoint is generated again.
+    subcommand_decorated_by_key: typing.ClassVar[
+        dict[_base.Register.Key, tuple[frozenset[str], _base.Decorated]]
+    ] = {}
 
     AddArgument: typing.ClassVar = _AddArgument
     Annotated: typing.ClassVar = _Annotated
@@ -402,31 +506,47 @@ class Decorator[** Params, Return](_base.Decorator[Params, Return]):
     def gen_decorated(self, key: Key) -> _base.Decorated[Params, Return]:
         match key:
             case str(name):
-                register_key = _base.Register.Key([*re.sub(r'.<.*>', '', name).split('.')])
+                register_key = _base.Register.Key.of_name(name)
             case tuple(register_key):
                 ...
             case _base.Decorated() as decorated:
                 register_key = decorated.register_key
-            case _base.Decoratee() as decoratee:
-                register_key = _base.Register.Key([
-                    *re.sub(r'.<.*>', '', '.'.join([decoratee.__module__, decoratee.__qualname__])).split('.')
-                ])
+            case decoratee if callable(decoratee):
+                register_key = _base.Register.Key.of_name(f'{decoratee.__module__}.{decoratee.__qualname__}')
             case _: assert False, 'Unreachable'  # pragma: no cover
 
-        if (decorated := self.register.decorateds.get(register_key)) is None:
-            def decoratee(subcommand: typing.Literal[*sorted(self.register.links.get(register_key, set()))]) -> None:  # noqa
-                self.get_argument_parser(register_key).print_usage()
+        if (decorated := self.register.decorateds.get(register_key)) is not None:
+            return decorated
+
+        names = frozenset(self.register.links.get(register_key, set()))
+        match self.subcommand_decorated_by_key.get(register_key):
+            case (cached_names, decorated) if cached_names == names:
+                return decorated
 
-            # Using the local variables in function signature converts the entire annotation to a string without
-            #  evaluating it. Force evaluation of the annotation.
-            #  ref. https://peps.python.org/pep-0563/#resolving-type-hints-at-runtime
-            decoratee.__annotations__['subcommand'] = eval(decoratee.__annotations__['subcommand'], None, locals())
+        def decoratee(subcommand: typing.Literal[*sorted(names)]) -> None:  # noqa
+            self.get_argument_parser(register_key).print_usage()
 
-            decorated = self(decoratee)
+        # Using the local variables in function signature converts the entire annotation to a string without
+        #  evaluating it. Force evaluation of the annotation.
+        #  ref. https://peps.python.org/pep-0563/#resolving-type-hints-at-runtime
+        decoratee.__annotations__['subcommand'] = eval(decoratee.__annotations__['subcommand'], None, locals())
+
+        decorated = self(decoratee)
+        self.subcommand_decorated_by_key[register_key] = names, decorated
 
         return decorated
 
+    def gen_parameters(self, decorated: _base.Decorated[Params, Return]) -> tuple[_Parameter, ...]:
+        if (parameters := self.parameters_by_decoratee.get(id(decorated.decoratee))) is None:
+            parameters = self.parameters_by_decoratee.setdefault_instance(
+                decorated.decoratee, tuple(map(_Parameter.of_parameter, decorated.signature.parameters.values()))
+            )
+
+        return parameters
+
     def get_argument_parser(self, key: Key) -> ArgumentParser[Params, Return]:
+        import pprint
+
         decorated = self.gen_decorated(key)
 
         argument_parser = ArgumentParser(
@@ -437,14 +557,11 @@ class Decorator[** Params, Return](_base.Decorator[Params, Return]):
             formatter_class=argparse.RawTextHelpFormatter
         )
 
-        for parameter in decorated.signature.parameters.values():
-            if parameter.kind is inspect.Parameter.VAR_KEYWORD:
+        for parameter in self.gen_parameters(decorated):
+            if parameter.add_argument_params is None:
                 # Var keywords will are parsed on a second pass.
                 continue
-            add_argument_params = dict(filter(
-                lambda item: not isinstance(item[1], typing.Hashable) or item[1] is not ...,
-                dataclasses.asdict(_AddArgument().of_parameter(parameter)).items()
-            ))
+            add_argument_params = dict(parameter.add_argument_params)
             argument_parser.add_argument(*add_argument_params.pop('name_or_flags'), **add_argument_params)
 
         return argument_parser
@@ -452,7 +569,7 @@ class Decorator[** Params, Return](_base.Decorator[Params, Return]):
     def run(self, decorated_or_key: _base.Decorated | _base.Register.Key | str, args: list[str] = ...) -> None:
         match decorated_or_key:
             case str():
-                register_key = _base.Register.Key([*re.sub(r'.<.*>', '', decorated_or_key).split('.')])
+                register_key = _base.Register.Key.of_name(decorated_or_key)
             case _base.Decorated():
                 register_key = decorated_or_key.register_key
             case tuple():
@@ -472,23 +589,12 @@ class Decorator[** Params, Return](_base.Decorator[Params, Return]):
 
         # Note that this may be the registered entrypoint of a submodule, not the entrypoint that is decorated.
         args, kwargs = [], {}
-        for _parameter in decorated.signature.parameters.values():
-            side_effects = []
-            if typing.get_origin(_parameter.annotation) is typing.Annotated:
-                for annotation in typing.get_args(_parameter.annotation):
-                    match annotation:
-                        case _SideEffect(side_effect):
-                            side_effects.append(side_effect)
-
-            side_effect = [
-                *itertools.accumulate(side_effects, func=lambda x, y: lambda z: x(y(z)), initial=lambda x: x)
-            ][-1]
-
+        for _parameter in self.gen_parameters(decorated):
             values = []
             match _parameter.kind:
                 case inspect.Parameter.POSITIONAL_ONLY:
                     values = [parsed_args.pop(_parameter.name)]
-                    args.append(side_effect(values[0]))
+                    args.append(values[0])
                 case inspect.Parameter.POSITIONAL_OR_KEYWORD | inspect.Parameter.KEYWORD_ONLY:
                     values = [parsed_args.pop(_parameter.name)]
                     kwargs[_parameter.name] = values[0]
@@ -496,20 +602,20 @@ class Decorator[** Params, Return](_base.Decorator[Params, Return]):
                     values = [parsed_args.pop(_parameter.name)][0][0]
                     args += values
                 case inspect.Parameter.VAR_KEYWORD:
-                    parser = argparse.ArgumentParser()
-                    for remainder_arg in remainder_args:
-                        if remainder_arg.startswith('--'):
-                            parser.add_argument(
-                                remainder_arg, type=lambda arg: ParseOne(t=_parameter.annotation).parse_arg(arg)
-                            )
+                    parser, parse_arg = argparse.ArgumentParser(), _parameter.parse_one.parse_arg
+                    # A flag may be repeated (the last value wins), but may only be added to the parser once.
+                    for flag in dict.fromkeys(arg for arg in remainder_args if arg.startswith('--')):
+                        parser.add_argument(flag, type=parse_arg)
                     remainder_ns = parser.parse_args(remainder_args)
                     remainder_args = []
-                    remainder_kwargs = dict(vars(remainder_ns).items())
+                    remainder_kwargs = vars(remainder_ns)
 
                     values = remainder_kwargs.values()
                     kwargs.update(remainder_kwargs)
 
-            [side_effect(value) for side_effect in side_effects for value in values]
+            if _parameter.side_effect is not None:
+                for value in values:
+                    _parameter.side_effect(value)
 
         assert not parsed_args, f'Unrecognized args: {parsed_args!r}.'
         assert not remainder_args, f'Unrecognized args: {remainder_args!r}.'
@@ -517,6 +623,9 @@ class Decorator[** Params, Return](_base.Decorator[Params, Return]):
         return_ = decorated(*args, **kwargs)
         match decorated:
             case _base.AsyncDecorated():
+                # asyncio is most of this module's import time and only async entrypoints need it.
+                import asyncio
+
                 return asyncio.run(return_)
             case _base.MultiDecorated():
                 return return_
@@ -4,7 +4,7 @@ import abc
 import dataclasses
 import inspect
 import logging
-import types
+import textwrap
 import typing
 
 from . import _base
@@ -13,15 +13,17 @@ from . import _base
 Level = typing.Literal['CRITICAL', 'ERROR', 'WARNING', 'INFO', 'DEBUG', 'NOTSET']
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class EnterContext[** Params, Return](
     _base.EnterContext,
     abc.ABC,
 ):
-    call_level: Level
-    err_level: Level
+    # Returns the `inspect.BoundArguments.arguments` that `signature.bind` would.
+    bind: typing.Callable[Params, dict[str, typing.Any]]
+    call_level: int
+    err_level: int
     logger: logging.Logger
-    ok_level: Level
+    ok_level: int
     signature: inspect.Signature
 
     @abc.abstractmethod
@@ -29,11 +31,15 @@ class EnterContext[** Params, Return](
         self,
         *args: Params.args,
         **kwargs: Params.kwargs,
-    ) -> (ExitContext[Params, Return], _base.EnterContext[Params, Return]):
-        bound_arguments = self.signature.bind(*args, **kwargs)
+    ) -> (ExitContext[Params, Return], _base.EnterContext[Params, Return]) | _base.EnterContext[Params, Return]:
+        if not self.logger.isEnabledFor(min(self.call_level, self.err_level, self.ok_level)):
+            # Nothing would be logged on the way in or out, so skip binding and the exit context altogether.
+            return self.next_enter_context
+
+        bound_arguments = inspect.BoundArguments(self.signature, self.bind(*args, **kwargs))
 
         self.logger.log(
-            logging.getLevelNamesMapping()[self.call_level],
+            self.call_level,
             '%s',
             bound_arguments,
         )
@@ -46,15 +52,15 @@ class EnterContext[** Params, Return](
         ), self.next_enter_context
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class ExitContext[** Params, Return](
     _base.ExitContext,
     abc.ABC,
 ):
     bound_arguments: inspect.BoundArguments
-    err_level: Level
+    err_level: int
     logger: logging.Logger
-    ok_level: Level
+    ok_level: int
 
     @abc.abstractmethod
     def __call__(
@@ -63,14 +69,14 @@ class ExitContext[** Params, Return](
     ) -> _base.Raise | Return:
         if isinstance(result, _base.Raise):
             self.logger.log(
-                logging.getLevelNamesMapping()[self.err_level],
+                self.err_level,
                 '%s raised %s',
                 self.bound_arguments, result.exc_val,
                 #exc_info=(result.exc_type, result.exc_val, result.exc_tb),
             )
         else:
             self.logger.log(
-                logging.getLevelNamesMapping()[self.ok_level],
+                self.ok_level,
                 '%s -> %s',
                 self.bound_arguments,
                 result,
@@ -79,7 +85,7 @@ class ExitContext[** Params, Return](
         return result
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class AsyncEnterContext[** Params, Return](
     EnterContext[Params, Return],
     _base.AsyncEnterContext[Params, Return],
@@ -89,10 +95,10 @@ class AsyncEnterContext[** Params, Return](
         *args: Params.args,
         **kwargs: Params.kwargs
     ) -> tuple[AsyncExitContext[Params, Return], _base.AsyncEnterContext[Params, Return]] | Return:
-        return super().__call__(*args, **kwargs)
+        return super(AsyncEnterContext, self).__call__(*args, **kwargs)
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class MultiEnterContext[** Params, Return](
     EnterContext[Params, Return],
     _base.MultiEnterContext[Params, Return],
@@ -103,27 +109,27 @@ class MultiEnterContext[** Params, Return](
         *args: Params.args,
         **kwargs: Params.kwargs
     ) -> tuple[MultiExitContext[Params, Return], _base.MultiEnterContext[Params, Return]] | Return:
-        return super().__call__(*args, **kwargs)
+        return super(MultiEnterContext, self).__call__(*args, **kwargs)
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class AsyncExitContext[** Params, Return](
     ExitContext[Params, Return],
     _base.AsyncExitContext[Params, Return],
 ):
 
     async def __call__(self, result: _base.Raise | Return) -> _base.Raise | Return:
-        return super().__call__(result)
+        return super(AsyncExitContext, self).__call__(result)
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class MultiExitContext[** Params, Return](
     ExitContext[Params, Return],
     _base.MultiExitContext[Params, Return],
 ):
 
     def __call__(self, result: _base.Raise | Return) -> _base.Raise | Return:
-        return super().__call__(result)
+        return super(MultiExitContext, self).__call__(result)
 
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
@@ -140,23 +146,68 @@ class Decorator[** Params, Return](_base.Decorator[Params, Return]):
     ) -> _base.Decorated[Params, Return]:
         decoratee = super().__call__(decoratee)
 
+        # Not subscripted: calling a generic alias sets `__orig_class__`, which slotted contexts have no room for.
         match decoratee:
             case _base.AsyncDecorated():
-                enter_context_t = AsyncEnterContext[Params, Return]
+                enter_context_t = AsyncEnterContext
             case _base.MultiDecorated():
-                enter_context_t = MultiEnterContext[Params, Return]
+                enter_context_t = MultiEnterContext
             case _: assert False, 'Unreachable'  # pragma: no cover
 
+        # Generate `bind` with the same parameter list as the decoratee, as SQLiteCache does for `dumps_key`. Defaults
+        #  are replaced with a sentinel so that, like `inspect.Signature.bind`, only arguments actually given are kept.
+        parameters = [*decoratee.signature.parameters.values()]
+        argument_sources, parameter_sources = [], []
+        for i, parameter in enumerate(parameters):
+            match parameter.kind:
+                case parameter.VAR_POSITIONAL:
+                    argument_sources.append(f'({parameter.name!r}, {parameter.name} or __missing)')
+                    parameter_sources.append(f'*{parameter.name}')
+                    continue
+                case parameter.VAR_KEYWORD:
+                    argument_sources.append(f'({parameter.name!r}, {parameter.name} or __missing)')
+                    parameter_sources.append(f'**{parameter.name}')
+                    continue
+                case parameter.KEYWORD_ONLY:
+                    if i == 0 or parameters[i - 1].kind not in {parameter.VAR_POSITIONAL, parameter.KEYWORD_ONLY}:
+                        parameter_sources.append('*')
+
+            argument_sources.append(f'({parameter.name!r}, {parameter.name})')
+            if parameter.default is parameter.empty:
+                parameter_sources.append(parameter.name)
+            else:
+                parameter_sources.append(f'{parameter.name}=__missing')
+
+            if parameter.kind == parameter.POSITIONAL_ONLY and (
+                i + 1 == len(parameters) or parameters[i + 1].kind != parameter.POSITIONAL_ONLY
+            ):
+                parameter_sources.append('/')
+
+        namespace = {'__missing': object()}
+        exec(textwrap.dedent(f'''
+            def bind({', '.join(parameter_sources)}):
+                return {{
+                    name: value for name, value in ({''.join(f'{source}, ' for source in argument_sources)})
+                    if value is not __missing
+                }}
+        '''), namespace)
+        bind = namespace['bind']
+        # Arguments are bound here first, so a bad call's TypeError should name the decoratee.
+        bind.__name__, bind.__qualname__ = decoratee.__name__, decoratee.__qualname__
+
         logger = logging.getLogger(str(decoratee.register_key)) if self.logger is ... else self.logger
+        # Resolve level names once here rather than on every call.
+        level_by_name = logging.getLevelNamesMapping()
 
         decorated = self.register.decorateds[decoratee.register_key] = dataclasses.replace(
             decoratee,
             enter_context=enter_context_t(
-                call_level=self.call_level,
-                err_level=self.err_level,
+                bind=bind,
+                call_level=level_by_name[self.call_level],
+                err_level=level_by_name[self.err_level],
                 logger=logger,
                 next_enter_context=decoratee.enter_context,
-                ok_level=self.ok_level,
+                ok_level=level_by_name[self.ok_level],
                 signature=decoratee.signature,
             ),
         )
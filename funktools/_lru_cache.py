@@ -5,7 +5,9 @@ import asyncio
 import collections
 import concurrent.futures
 import dataclasses
+import inspect
 import sys
+import textwrap
 import threading
 import typing
 
@@ -17,47 +19,75 @@ type Key = typing.Hashable
 type GenerateKey[** Params] = typing.Callable[Params, Key]
 
 
+class Future[Return](concurrent.futures.Future[Return]):
+    """A `concurrent.futures.Future` whose result is read without taking its lock once it has been set."""
+
+    def result(self, timeout: float | None = None) -> Return:
+        # A finished future never changes state again, and `_result` is assigned before `_state` under the lock.
+        if self._state == concurrent.futures._base.FINISHED and self._exception is None:
+            return self._result
+        return super().result(timeout)
+
+
+# Separates positional from keyword arguments in a generated key, so that e.g. `f('a', 1)` and `f(a=1)` differ.
+kwargs_mark = object()
+
+
+def generate_key(*args: typing.Hashable, **kwargs: typing.Hashable) -> Key:
+    """Returns a flat tuple of the arguments.
+
+    Decorated calls arrive with `kwargs` already sorted (see `_base.Decorated.norm_kwargs`), so keyword order needs no
+    further handling here.
+    """
+
+    if not kwargs:
+        return args
+    return *args, kwargs_mark, *kwargs.items()
+
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class EnterContext[** Params, Return](
     _base.EnterContext[Params, Return],
     abc.ABC,
 ):
-    exit_context_by_key: collections.OrderedDict[Key, ExitContext[Params, Return]] = dataclasses.field(
-        default_factory=collections.OrderedDict
-    )
+    # Entries hold only the future a result is delivered through. The exit context that completes it is released once
+    #  the call returns.
+    future_by_key: collections.OrderedDict[
+        Key, asyncio.Future[Return] | concurrent.futures.Future[Return]
+    ] = dataclasses.field(default_factory=collections.OrderedDict)
     generate_key: GenerateKey[Params]
     size: int
 
     @abc.abstractmethod
     def __call__(
         self,
-        *args: Params.args,
-        **kwargs: Params.kwargs
+        key: Key,
     ) -> (
         (ExitContext[Params, Return], _base.EnterContext[Params, Return])
         | asyncio.Future[Return]
         | concurrent.futures.Future[Return]
     ):
-        key = self.generate_key(*args, **kwargs)
-        while self.size < len(self.exit_context_by_key):
-            self.exit_context_by_key.popitem(last=False)
-        if (exit_context := self.exit_context_by_key.pop(key, None)) is None:
-            exit_context = self.exit_context_by_key[key] = self.exit_context_t()
+        future_by_key = self.future_by_key
+        if (future := future_by_key.get(key)) is None:
+            exit_context = self.exit_context_t()
+            future_by_key[key] = exit_context.future
+            # Only a miss grows the cache, and only by one, so hits skip eviction and a miss evicts at most once.
+            if self.size < len(future_by_key):
+                future_by_key.popitem(last=False)
             return exit_context, self.next_enter_context
 
-        self.exit_context_by_key[key] = exit_context
-        return exit_context.future
+        future_by_key.move_to_end(key)
+        return future
 
     def __get__(self, instance: _base.Instance, owner) -> EnterContext[Params, Return]:
-        with self.instance_lock:
-            if (enter_context := self.enter_context_by_instance.get(instance)) is None:
-                enter_context = self.enter_context_by_instance[instance] = dataclasses.replace(
-                    self,
-                    next_enter_context=self.next_enter_context.__get__(instance, owner),
-                    exit_context_by_key=collections.OrderedDict(),
-                    instance=instance,
-                )
+        if (enter_context := self.enter_context_by_instance.get(id(instance))) is not None:
             return enter_context
+        return self.enter_context_by_instance.setdefault_instance(instance, _base.replace(
+            self,
+            next_enter_context=self.next_enter_context.__get__(instance, owner),
+            future_by_key=collections.OrderedDict(),
+            instance=instance,
+        ))
 
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
@@ -81,21 +111,23 @@ class AsyncEnterContext[** Params, Return](
     EnterContext[Params, Return],
     _base.AsyncEnterContext[Params, Return],
 ):
-    lock: asyncio.Lock = dataclasses.field(default_factory=asyncio.Lock)
-
     async def __call__(
         self,
         *args: Params.args,
         **kwargs: Params.kwargs
     ) -> (AsyncExitContext[Params, Return], _base.AsyncEnterContext[Params, Return]) | Return:
-        async with self.lock:
-            result = super().__call__(*args, **kwargs)
+        # No lock is needed. The lookup and the insertion of a miss's future don't await, so no other coroutine on the
+        #  loop can interleave with them, and a herd of misses on one key all find the first one's future.
+        result = super().__call__(self.generate_key(*args, **kwargs))
 
-        # FIXME: what if someone explicitly returns a Future from their own code? We don't want to await it.
-        if isinstance(result, asyncio.Future):
-            result = await result
-
-        return result
+        # A miss is the (exit context, next enter context) tuple. Anything else is the cache's own future, never a
+        #  value from the decoratee, so a decoratee returning a future is not mistaken for a hit.
+        if type(result) is tuple:
+            return result
+        # Awaiting a future that is already done still goes through its `__await__` generator.
+        if result.done():
+            return result.result()
+        return await result
 
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
@@ -110,13 +142,24 @@ class MultiEnterContext[** Params, Return](
         *args: Params.args,
         **kwargs: Params.kwargs
     ) -> (MultiExitContext[Params, Return], _base.MultiEnterContext[Params, Return]) | Return:
+        key = self.generate_key(*args, **kwargs)
+        future_by_key = self.future_by_key
+        # Hits skip the lock, as `functools.lru_cache` does. Both dict operations are atomic on their own, and a
+        #  future found here is valid even if another thread evicts its key before it is moved to the end.
+        if (future := future_by_key.get(key)) is not None:
+            try:
+                future_by_key.move_to_end(key)
+            except KeyError:
+                pass
+            return future.result()
+
+        # Misses take the lock and look again, so that concurrent misses on a key share one call.
         with self.lock:
-            result = super().__call__(*args, **kwargs)
-
-        if isinstance(result, concurrent.futures.Future):
-            result = result.result()
+            result = super().__call__(key)
 
-        return result
+        if type(result) is tuple:
+            return result
+        return result.result()
 
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
@@ -135,7 +178,7 @@ class MultiExitContext[** Params, Return](
     ExitContext[Params, Return],
     _base.MultiExitContext[Params, Return],
 ):
-    future: concurrent.futures.Future = dataclasses.field(default_factory=concurrent.futures.Future)
+    future: Future = dataclasses.field(default_factory=Future)
 
     def __call__(self, result: _base.Raise | Return) -> Return:
         return super().__call__(result)
@@ -146,7 +189,7 @@ class Decorator[** Params, Return](
     _base.Decorator[Params, Return],
 ):
     size: int = sys.maxsize
-    generate_key: GenerateKey[Params] = lambda *args, **kwargs: (tuple(args), tuple(sorted([*kwargs.items()])))
+    generate_key: GenerateKey[Params] = ...
 
     register: typing.ClassVar[_base.Register] = _base.Register()
 
@@ -157,6 +200,36 @@ class Decorator[** Params, Return](
     ) -> _base.Decorated[Params, Return]:
         decoratee = super().__call__(decoratee)
 
+        if (generate_key_ := self.generate_key) is ...:
+            generate_key_ = generate_key
+            try:
+                # The parameters the decoratee itself accepts. `decoratee.signature` follows `__wrapped__`, but e.g. a
+                #  `functools.wraps` wrapper may take arguments its wrapped function doesn't.
+                parameters = [*inspect.signature(decoratee.decoratee, follow_wrapped=False).parameters.values()]
+            except (TypeError, ValueError):
+                parameters = []
+            if parameters and all(
+                parameter.kind in {parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD}
+                and parameter.default is parameter.empty
+                for parameter in parameters
+            ):
+                # Every argument is required and lands in the same parameter however it's passed, so the key is just
+                #  the arguments' values. Generate it with the decoratee's parameter list, as SQLiteCache does for
+                #  `dumps_key`, so that neither `**kwargs` nor the branch on it is paid for.
+                names = [parameter.name for parameter in parameters]
+                parameter_sources = [*names]
+                if (n_positional_only := sum(parameter.kind == parameter.POSITIONAL_ONLY for parameter in parameters)):
+                    parameter_sources.insert(n_positional_only, '/')
+                key_source = names[0] if len(names) == 1 else f'({', '.join(names)})'
+                namespace = {}
+                exec(textwrap.dedent(f'''
+                    def generate_key({', '.join(parameter_sources)}):
+                        return {key_source}
+                '''), namespace)
+                generate_key_ = namespace['generate_key']
+                # Arguments are bound here first, so a bad call's TypeError should name the decoratee.
+                generate_key_.__name__, generate_key_.__qualname__ = decoratee.__name__, decoratee.__qualname__
+
         match decoratee:
             case _base.AsyncDecorated():
                 enter_context_t = AsyncEnterContext
@@ -167,7 +240,7 @@ class Decorator[** Params, Return](
         decorated = self.register.decorateds[decoratee.register_key] = dataclasses.replace(
             decoratee,
             enter_context=enter_context_t(
-                generate_key=self.generate_key,
+                generate_key=generate_key_,
                 next_enter_context=decoratee.enter_context,
                 size=self.size,
             ),
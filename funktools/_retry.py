@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import abc
-import annotated_types
 import dataclasses
 import sys
 import typing
 
 from . import _base
 
+if typing.TYPE_CHECKING:
+    import annotated_types
+
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class Context[** Params, Return](
@@ -40,6 +42,13 @@ class EnterContext[** Params, Return](
     _base.EnterContext[Params, Return],
     abc.ABC,
 ):
+    # An exit context holds nothing but `n` and `next_enter_context`, so every call through this context shares one.
+    exit_context: ExitContext[Params, Return] = dataclasses.field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, 'exit_context', self.exit_context_t(n=self.n, next_enter_context=self.next_enter_context)
+        )
 
     @abc.abstractmethod
     def __call__(
@@ -47,7 +56,7 @@ class EnterContext[** Params, Return](
         *args: Params.args,
         **kwargs: Params.kwargs
     ) -> (ExitContext[Params, Return], _base.EnterContext[Params, Return]):
-        return self.exit_context_t(n=self.n, next_enter_context=self.next_enter_context), self.next_enter_context
+        return self.exit_context, self.next_enter_context
 
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
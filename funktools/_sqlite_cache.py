@@ -1,78 +1,192 @@
 from __future__ import annotations
 
 import abc
-import annotated_types
-import ast
 import asyncio
-import collections
+import contextlib
 import dataclasses
+import functools
 import pathlib
+import pickle
 import textwrap
 import threading
 import typing
+import weakref
 
 import sqlite3
 
 from . import _base
 
+if typing.TYPE_CHECKING:
+    import annotated_types
+
 type Key = str
 
+# Part of every table name. Bump it whenever the table's schema or the default encoding of its values changes, so that
+#  tables written by older versions are left alone rather than misread.
+table_version = 2
+
+# Returned by `EnterContext.load` on a miss. `None` is a valid cached result.
+missing = object()
+
+# A database shared by every connection in the process, that lives only as long as one of them is open.
+default_db_path = 'file::memory:?cache=shared'
+
 type LoadsValue[Return] = typing.Callable[[bytes], Return]
 type DumpsKey[** Params] = typing.Callable[Params, Key]
 type DumpsValue[Return] = typing.Callable[[Return], bytes]
 
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Writes:
+    """Results waiting to be written to `table_name`.
+
+    Rows are committed together in a single transaction once `size` of them are pending, `duration` seconds after the
+    first of them was put, when the owning context is collected, or when the interpreter exits. Until then,
+    `value_by_key` is consulted before the table.
+    """
+    connection: sqlite3.Connection
+    duration: typing.Annotated[float, annotated_types.Gt(0.0)]
+    insert_sql: str = dataclasses.field(init=False)
+    lock: threading.Lock = dataclasses.field(default_factory=threading.Lock)
+    size: typing.Annotated[int, annotated_types.Gt(0)]
+    table_name: str
+    value_by_key: dict[Key, bytes] = dataclasses.field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, 'insert_sql', f'INSERT OR REPLACE INTO `{self.table_name}` (key, value) VALUES (?, ?)')
+        weakref.finalize(self, self._finalize, self.connection, self.lock, self.insert_sql, self.value_by_key)
+
+    @staticmethod
+    def _commit(connection: sqlite3.Connection, insert_sql: str, value_by_key: dict[Key, bytes]) -> None:
+        if value_by_key:
+            with connection:
+                connection.execute('BEGIN')
+                connection.executemany(insert_sql, [*value_by_key.items()])
+            # Only forget pending values once they are readable from the table.
+            value_by_key.clear()
+
+    @staticmethod
+    def _flush(
+        connection: sqlite3.Connection, lock: threading.Lock, insert_sql: str, value_by_key: dict[Key, bytes]
+    ) -> None:
+        with lock:
+            Writes._commit(connection, insert_sql, value_by_key)
+
+    @staticmethod
+    def _finalize(
+        connection: sqlite3.Connection, lock: threading.Lock, insert_sql: str, value_by_key: dict[Key, bytes]
+    ) -> None:
+        # This is a cache. If the database has gone away by the time we get here, the pending results are just lost.
+        with contextlib.suppress(sqlite3.Error):
+            Writes._flush(connection, lock, insert_sql, value_by_key)
+
+    def flush(self) -> None:
+        self._flush(self.connection, self.lock, self.insert_sql, self.value_by_key)
+
+    def put(self, key: Key, value: bytes) -> None:
+        with self.lock:
+            self.value_by_key[key] = value
+            if len(self.value_by_key) >= self.size:
+                self._commit(self.connection, self.insert_sql, self.value_by_key)
+            elif len(self.value_by_key) == 1:
+                # The first result of a batch. Commit it within `duration` even if the batch never fills. The timer
+                #  holds no reference to `self`, so it doesn't keep the finalizer from running.
+                timer = threading.Timer(
+                    self.duration, self._finalize, (self.connection, self.lock, self.insert_sql, self.value_by_key)
+                )
+                timer.daemon = True
+                timer.start()
+
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class EnterContext[** Params, Return](
     _base.EnterContext[Params, Return],
     abc.ABC,
 ):
+    batch_duration: typing.Annotated[float, annotated_types.Gt(0.0)]
+    batch_size: typing.Annotated[int, annotated_types.Gt(0)]
     connection: sqlite3.Connection
+    # Lookups share one cursor rather than create one per call. Multi contexts take their lock around it.
+    cursor: sqlite3.Cursor = dataclasses.field(init=False)
     dumps_key: DumpsKey[Params]
     dumps_value: DumpsValue[Return]
-    exit_context_by_key: collections.OrderedDict[Key, ExitContext[Params, Return]]
+    exit_context_by_key: dict[Key, ExitContext[Params, Return]]
     loads_value: LoadsValue[Return]
+    select_sql: str = dataclasses.field(init=False)
     table_name: str
+    writes: Writes = dataclasses.field(init=False)
 
     def __post_init__(
         self: AsyncEnterContext[Params, Return] | MultiEnterContext[Params, Return],
     ) -> None:
+        # TEXT rather than the older STRING, whose NUMERIC affinity stored e.g. '1', '01' and '1.0' as the same key.
+        #  `table_name` is versioned (see `table_version`), so an existing table with the older schema is never reused.
         self.connection.execute(textwrap.dedent(f'''
             CREATE TABLE IF NOT EXISTS `{self.table_name}` (
-                key STRING PRIMARY KEY NOT NULL UNIQUE,
-                value STRING NOT NULL
-            )
+                key TEXT PRIMARY KEY NOT NULL,
+                value BLOB NOT NULL
+            ) WITHOUT ROWID
         ''').strip())
+        object.__setattr__(self, 'cursor', self.connection.cursor())
+        object.__setattr__(self, 'select_sql', f'SELECT value FROM `{self.table_name}` WHERE key = ?')
+        object.__setattr__(
+            self, 'writes', Writes(
+                connection=self.connection,
+                duration=self.batch_duration,
+                size=self.batch_size,
+                table_name=self.table_name,
+            )
+        )
 
     def __call__(
         self: AsyncEnterContext[Params, Return] | MultiEnterContext[Params, Return],
         key: Key,
     ):
-        match self.connection.execute(
-            f'SELECT value FROM `{self.table_name}` WHERE key = ?', (key,)
-        ).fetchall():
+        if (result := self.load(key)) is not missing:
+            return result
+        exit_context = self.exit_context_by_key[key] = self.new_exit_context(key)
+
+        return exit_context, self.next_enter_context
+
+    def load(self, key: Key) -> Return | object:
+        if (value := self.lookup(key)) is None:
+            return missing
+        try:
+            return self.loads_value(value)
+        except Exception:  # noqa
+            # A value that can't be loaded (e.g. written with another `dumps_value`) is a miss. It gets overwritten.
+            return missing
+
+    def lookup(self, key: Key) -> bytes | None:
+        if (value := self.writes.value_by_key.get(key)) is not None:
+            return value
+        # `fetchall` rather than `fetchone` so that the statement runs to completion and doesn't hold a read open.
+        match self.cursor.execute(self.select_sql, (key,)).fetchall():
             case [[value]]:
-                return ast.literal_eval(value)
-        exit_context = self.exit_context_by_key[key] = self.exit_context_t(
-            connection=self.connection,
+                return value
+        return None
+
+    def new_exit_context(
+        self: AsyncEnterContext[Params, Return] | MultiEnterContext[Params, Return],
+        key: Key,
+    ) -> ExitContext[Params, Return]:
+        return self.exit_context_t(
             dumps_value=self.dumps_value,
+            exit_context_by_key=self.exit_context_by_key,
             key=key,
-            table_name=self.table_name,
+            writes=self.writes,
         )
 
-        return exit_context, self.next_enter_context
-
     def __get__(self, instance, owner):
-        with self.instance_lock:
-            if (enter_context := self.enter_context_by_instance.get(instance)) is None:
-                enter_context = self.enter_context_by_instance[instance] = dataclasses.replace(
-                    self,
-                    connection=self.connection,
-                    instance=instance,
-                    next_enter_context=self.next_enter_context.__get__(instance, owner),
-                    table_name=f'{self.table_name}__{instance}',
-                )
+        if (enter_context := self.enter_context_by_instance.get(id(instance))) is not None:
             return enter_context
+        return self.enter_context_by_instance.setdefault_instance(instance, dataclasses.replace(
+            self,
+            connection=self.connection,
+            instance=instance,
+            next_enter_context=self.next_enter_context.__get__(instance, owner),
+            table_name=f'{self.table_name}__{instance}',
+        ))
 
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
@@ -80,10 +194,10 @@ class ExitContext[** Params, Return](
     _base.ExitContext[Params, Return],
     abc.ABC,
 ):
-    connection: sqlite3.Connection
     dumps_value: DumpsValue[Return]
+    exit_context_by_key: dict[Key, ExitContext[Params, Return]]
     key: Key
-    table_name: str
+    writes: Writes
 
     @abc.abstractmethod
     def __call__(
@@ -93,14 +207,15 @@ class ExitContext[** Params, Return](
 
         try:
             if isinstance(result, _base.Raise):
-                raise result.e
+                raise result.exc_val
             else:
-                self.connection.execute(
-                    f'''INSERT INTO `{self.table_name}` (key, value) VALUES (?, ?)''',
-                    (self.key, self.dumps_value(result))
-                )
+                self.writes.put(self.key, self.dumps_value(result))
                 return result
         finally:
+            # Deregister before waking waiters. Callers only register a key that has no entry, so an entry that is this
+            #  context is ours to remove, and no one else removes it.
+            if self.exit_context_by_key.get(self.key) is self:
+                del self.exit_context_by_key[self.key]
             self.event.set()
 
 
@@ -109,9 +224,7 @@ class AsyncEnterContext[** Params, Return](
     EnterContext[Params, Return],
     _base.AsyncEnterContext[Params, Return],
 ):
-    exit_context_by_key: collections.OrderedDict[Key, AsyncExitContext[Params, Return]] = dataclasses.field(
-        default_factory=collections.OrderedDict
-    )
+    exit_context_by_key: dict[Key, AsyncExitContext[Params, Return]] = dataclasses.field(default_factory=dict)
     lock: asyncio.Lock = dataclasses.field(default_factory=asyncio.Lock)
 
     async def __call__(
@@ -121,13 +234,13 @@ class AsyncEnterContext[** Params, Return](
     ) -> (AsyncExitContext[Params, Return], _base.AsyncEnterContext[Params, Return]) | Return:
         key = self.dumps_key(*args, **kwargs)
         async with self.lock:
-            if (exit_context := self.exit_context_by_key.get(key)) is not None:
+            # Look again after waking. If the call raised, another waiter may have registered to call again first.
+            while (exit_context := self.exit_context_by_key.get(key)) is not None:
                 self.lock.release()
                 try:
                     await exit_context.event.wait()
                 finally:
                     await self.lock.acquire()
-                self.exit_context_by_key.pop(key, None)
 
             return super().__call__(key)
 
@@ -137,9 +250,8 @@ class MultiEnterContext[** Params, Return](
     EnterContext[Params, Return],
     _base.MultiEnterContext[Params, Return],
 ):
-    exit_context_by_key: collections.OrderedDict[Key, MultiExitContext[Params, Return]] = dataclasses.field(
-        default_factory=collections.OrderedDict
-    )
+    exit_context_by_key: dict[Key, MultiExitContext[Params, Return]] = dataclasses.field(default_factory=dict)
+    # Guards only the shared cursor. Calls in flight are tracked through `exit_context_by_key` alone.
     lock: threading.Lock = dataclasses.field(default_factory=threading.Lock)
 
     @property
@@ -152,16 +264,27 @@ class MultiEnterContext[** Params, Return](
         **kwargs: Params.kwargs,
     ) -> (MultiExitContext[Params, Return], _base.MultiEnterContext[Params, Return]) | Return:
         key = self.dumps_key(*args, **kwargs)
-        with self.lock:
-            if (exit_context := self.exit_context_by_key.get(key)) is not None:
-                self.lock.release()
-                try:
-                    exit_context.event.wait()
-                finally:
-                    self.lock.acquire()
-                self.exit_context_by_key.pop(key, None)
+        exit_context_by_key = self.exit_context_by_key
+        while True:
+            if (exit_context := exit_context_by_key.get(key)) is not None:
+                exit_context.event.wait()
+            if (result := self.load(key)) is not missing:
+                return result
 
-            return super().__call__(key)
+            # `dict.setdefault` is atomic, so exactly one of the threads racing to call for this key registers.
+            exit_context = self.new_exit_context(key)
+            if exit_context_by_key.setdefault(key, exit_context) is not exit_context:
+                continue
+            # A call that finished between the lookup above and registering wrote its result before deregistering.
+            if (result := self.load(key)) is not missing:
+                exit_context_by_key.pop(key, None)
+                exit_context.event.set()
+                return result
+            return exit_context, self.next_enter_context
+
+    def lookup(self, key: Key) -> bytes | None:
+        with self.lock:
+            return super().lookup(key)
 
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
@@ -188,11 +311,24 @@ class MultiExitContext[** Params, Return](
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class Decorator[** Params, Return](_base.Decorator[Params, Return]):
-    db_path: pathlib.Path | str = 'file::memory:?cache=shared'
+    """Cache results of the decorated function in the SQLite database at `db_path`.
+
+    Results are written in batches. A result is visible to later calls in this process as soon as the call returns, but
+    it is only committed to `db_path` once `batch_size` results are pending or `batch_duration` seconds after the first
+    of them, whichever comes first, and when the decorated function is collected or the interpreter exits. Until then,
+    other processes and connections sharing `db_path` don't see it, and it is lost if the process dies without exiting
+    normally (e.g. `os._exit` or a crash). Set `batch_size=1` to commit every result before its call returns.
+    """
+
+    # Longest a result is held in memory before being committed, even if the batch isn't full.
+    batch_duration: typing.Annotated[float, annotated_types.Gt(0.0)] = 1.0
+    # How many results to hold in memory before committing them to `db_path` in a single transaction.
+    batch_size: typing.Annotated[int, annotated_types.Gt(0)] = 2000
+    db_path: pathlib.Path | str = default_db_path
     dumps_key: DumpsKey = ...
-    dumps_value: DumpsValue[Return] = repr
+    dumps_value: DumpsValue[Return] = functools.partial(pickle.dumps, protocol=pickle.HIGHEST_PROTOCOL)
     duration: typing.Annotated[float, annotated_types.Ge(0.0)] | None = None
-    loads_value: LoadsValue[Return] = ast.literal_eval
+    loads_value: LoadsValue[Return] = pickle.loads
 
     def __call__(
         self,
@@ -202,10 +338,51 @@ class Decorator[** Params, Return](_base.Decorator[Params, Return]):
         decoratee = super().__call__(decoratee)
 
         if (dumps_key := self.dumps_key) is ...:
-            def dumps_key(*args, **kwargs) -> Key:
-                bound = decoratee.signature.bind(*args, **kwargs)
-                bound.apply_defaults()
-                return repr((bound.args, tuple(sorted(bound.kwargs))))
+            # Generate `dumps_key` with the same parameter list as the decoratee. The interpreter then binds arguments,
+            #  applies defaults, and raises the same TypeError for a bad call that `inspect.Signature.bind` would, with
+            #  no per-call signature introspection.
+            parameters = [*decoratee.signature.parameters.values()]
+            default_by_name = {}
+            keyword_sources, parameter_sources, positional_sources = [], [], []
+            for i, parameter in enumerate(parameters):
+                match parameter.kind:
+                    case parameter.POSITIONAL_ONLY | parameter.POSITIONAL_OR_KEYWORD:
+                        positional_sources.append(parameter.name)
+                    case parameter.VAR_POSITIONAL:
+                        positional_sources.append(f'*{parameter.name}')
+                        parameter_sources.append(f'*{parameter.name}')
+                    case parameter.KEYWORD_ONLY:
+                        if i == 0 or parameters[i - 1].kind not in {parameter.VAR_POSITIONAL, parameter.KEYWORD_ONLY}:
+                            parameter_sources.append('*')
+                        keyword_sources.append(f'({parameter.name!r}, {parameter.name})')
+                    case parameter.VAR_KEYWORD:
+                        keyword_sources.append(f'*{parameter.name}.items()')
+                        parameter_sources.append(f'**{parameter.name}')
+
+                if parameter.kind in {parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD}:
+                    continue
+                elif parameter.default is parameter.empty:
+                    parameter_sources.append(parameter.name)
+                else:
+                    default_by_name[parameter.name] = parameter.default
+                    parameter_sources.append(f'{parameter.name}=__default_by_name[{parameter.name!r}]')
+
+                if parameter.kind == parameter.POSITIONAL_ONLY and (
+                    i + 1 == len(parameters) or parameters[i + 1].kind != parameter.POSITIONAL_ONLY
+                ):
+                    parameter_sources.append('/')
+
+            namespace = {'__default_by_name': default_by_name, '__repr': repr, '__sorted': sorted}
+            exec(textwrap.dedent(f'''
+                def dumps_key({', '.join(parameter_sources)}):
+                    return __repr((
+                        ({''.join(f'{source}, ' for source in positional_sources)}),
+                        (*__sorted(({''.join(f'{source}, ' for source in keyword_sources)})),),
+                    ))
+            '''), namespace)
+            dumps_key = namespace['dumps_key']
+            # Arguments are bound here first, so a bad call's TypeError should name the decoratee.
+            dumps_key.__name__, dumps_key.__qualname__ = decoratee.__name__, decoratee.__qualname__
 
         match decoratee:
             case _base.AsyncDecorated():
@@ -214,15 +391,39 @@ class Decorator[** Params, Return](_base.Decorator[Params, Return]):
                 enter_context_t = MultiEnterContext
             case _: assert False, 'Unreachable'  # pragma: no cover
 
+        # Multi contexts may be entered from any thread. Writes are serialized by `Writes.lock`. Each instance of a
+        #  decorated method gets its own table and therefore its own statements. Keep enough of them prepared that
+        #  sqlite3 does not have to re-parse them on every call.
+        connection = sqlite3.connect(
+            self.db_path,
+            cached_statements=1024,
+            check_same_thread=False,
+            isolation_level=None,
+            # Only the default is a URI. Without `uri=True`, whether it's opened as one depends on how SQLite was built,
+            #  and otherwise it names a file (and, with WAL, its -wal and -shm files) in the working directory.
+            uri=self.db_path == default_db_path,
+        )
+        # WAL lets readers proceed during a commit, and with it `synchronous = NORMAL` only syncs at checkpoints rather
+        #  than on every commit. Losing the most recent results on power failure is acceptable for a cache. An in-memory
+        #  database ignores it.
+        connection.executescript(textwrap.dedent('''
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            PRAGMA temp_store = MEMORY;
+            PRAGMA cache_size = -65536;
+        '''))
+
         decorated = self.register.decorateds[decoratee.register_key] = dataclasses.replace(
             decoratee,
             enter_context=enter_context_t(
-                connection=sqlite3.connect(self.db_path, isolation_level=None),
+                batch_duration=self.batch_duration,
+                batch_size=self.batch_size,
+                connection=connection,
                 dumps_key=dumps_key,
                 dumps_value=self.dumps_value,
                 loads_value=self.loads_value,
                 next_enter_context=decoratee.enter_context,
-                table_name='__'.join(decoratee.register_key),
+                table_name=f'{'__'.join(decoratee.register_key)}__v{table_version}',
             ),
         )
 
@@ -1,6 +1,8 @@
 import inspect
+import sys
 import typing
 import functools
+import weakref
 
 __all__ = [
     "TemplateException",
@@ -22,17 +24,28 @@ class TemplateFunction:
         types2funcs: dict[tuple, typing.Callable],
         func_arg_infos: list["_FuncArgInfo"],
         instance: typing.Any,
+        matched_funcs: dict[typing.Hashable, typing.Callable],
     ):
         self.__name__ = name
         self.__annotations__ = annotations
         self._types2funcs = types2funcs
         self._func_arg_infos = func_arg_infos
         self._instance = instance
+        # Matches found by __call__, keyed by the types of the positional arguments and
+        # the names and types of the keyword arguments. The first match depends on
+        # nothing else, and adding a function never changes an earlier first match, so
+        # entries stay valid as functions are added.
+        self._matched_funcs = matched_funcs
 
     @staticmethod
     def new(name):
         return TemplateFunction(
-            name=name, annotations={}, types2funcs={}, func_arg_infos=[], instance=None
+            name=name,
+            annotations={},
+            types2funcs={},
+            func_arg_infos=[],
+            instance=None,
+            matched_funcs={},
         )
 
     def with_instance(self, instance):
@@ -42,6 +55,7 @@ class TemplateFunction:
             types2funcs=self._types2funcs,
             func_arg_infos=self._func_arg_infos,
             instance=instance,
+            matched_funcs=self._matched_funcs,
         )
 
     def __repr__(self):
@@ -51,41 +65,54 @@ class TemplateFunction:
         if self._instance is not None:
             args = (self._instance,) + args
 
-        val_types = [type(arg) for arg in args]
+        # A lone positional argument is keyed by its type alone, which is cheaper than
+        # building a tuple. Types, tuples of types, and tuples starting with a tuple
+        # never compare equal, so the three kinds of key can't collide.
+        if kwargs:
+            key = (
+                tuple(map(type, args)),
+                *[(name, type(val)) for name, val in kwargs.items()],
+            )
+        elif len(args) == 1:
+            key = type(args[0])
+        else:
+            key = tuple(map(type, args))
+
+        if (func := self._matched_funcs.get(key)) is not None:
+            return func(*args, **kwargs)
+
+        val_types = tuple(map(type, args))
 
         # The logic in this loop would be more natural in a
         # _FuncArgInfo.is_match method, but that has about a 30% overhead on
         # every call to a templated function.
+        num_args = len(args)
         for info in self._func_arg_infos:
+            # Positional arguments beyond the named parameters are never counted as
+            # matched below, so such a call can't match. Cheapest check first.
+            if num_args > len(info._parg_names):
+                continue
+
             not_a_match = False
-            argspec = info._fullargspec
 
             num_matched = 0
-            if defaults := argspec.defaults:
-                num_matched = len(
-                    set(argspec.args[-len(defaults) :]).difference(set(kwargs.keys()))
-                )
+            if defaulted_arg_names := info._defaulted_arg_names:
+                num_matched = len(defaulted_arg_names.difference(kwargs))
 
-            if kwonlydefaults := argspec.kwonlydefaults:
-                num_matched += len(
-                    set(kwonlydefaults.keys()).difference(set(kwargs.keys()))
-                )
-
-            if info._num_args_to_match != len(args) + len(kwargs) + num_matched:
+            if info._num_args_to_match != num_args + len(kwargs) + num_matched:
                 continue
 
-            for name in argspec.args[: len(val_types)]:
-                if name in kwargs:
-                    not_a_match = True
-                    break
-            if not_a_match:
-                continue
+            if kwargs:
+                for name in info._parg_names[: len(val_types)]:
+                    if name in kwargs:
+                        not_a_match = True
+                        break
+                if not_a_match:
+                    continue
 
-            for name, val_type, want_type in zip(
-                argspec.args, val_types, info._parg_types
-            ):
+            for val_type, want_type in zip(val_types, info._parg_types):
                 # _FuncArgInfo instance is the sentinal for "no annotation"
-                if want_type is not info and val_type != want_type:
+                if want_type is not info and val_type is not want_type:
                     not_a_match = True
                     break
 
@@ -93,11 +120,11 @@ class TemplateFunction:
             if not_a_match:
                 continue
 
-            annotations = argspec.annotations
+            annotations = info._annotations
             legal_arg_names = info._legal_arg_names
             for name, val in kwargs.items():
                 if (want_type := annotations.get(name, info)) is not info:
-                    if type(val) != want_type:
+                    if type(val) is not want_type:
                         not_a_match = True
                         break
                 elif name not in legal_arg_names:
@@ -109,6 +136,7 @@ class TemplateFunction:
                 continue
 
             if num_matched == info._num_args_to_match:
+                self._matched_funcs[key] = info._func
                 return info._func(*args, **kwargs)
 
         raise TemplateException("Cannot find templated function matching signature")
@@ -129,7 +157,13 @@ class TemplateFunction:
         if isinstance(types, tuple):
             types = tuple[types]
 
-        annotations["key"] = typing.Union[types, annotations.get("key", types)]
+        key_types = annotations.get("key", types)
+        if isinstance(types, type) or typing.get_origin(types) is tuple:
+            # Built in C. typing.Union re-collects and deduplicates every earlier key
+            # in Python, so registering N keys that way is quadratic.
+            annotations["key"] = types | key_types
+        else:
+            annotations["key"] = typing.Union[types, key_types]
 
         self._append_func_arg_info(func)
 
@@ -175,24 +209,59 @@ class TemplateFunction:
         return arg_info
 
 
+_fullargspec_by_func = weakref.WeakKeyDictionary()
+
+
+def _getfullargspec(func: typing.Callable) -> inspect.FullArgSpec:
+    """`inspect.getfullargspec`, cached for as long as `func` is alive.
+
+    The same function is otherwise inspected again whenever it is registered again,
+    e.g. under another key.
+    """
+    try:
+        return _fullargspec_by_func[func]
+    except KeyError:
+        fullargspec = _fullargspec_by_func[func] = inspect.getfullargspec(func)
+        return fullargspec
+    except TypeError:
+        # Not hashable or not weakly referenceable.
+        return inspect.getfullargspec(func)
+
+
 class _FuncArgInfo:
     """Information about the arguments for a function."""
 
+    __slots__ = (
+        "_annotations",
+        "_defaulted_arg_names",
+        "_fullargspec",
+        "_func",
+        "_legal_arg_names",
+        "_num_args_to_match",
+        "_parg_names",
+        "_parg_types",
+    )
+
     def __init__(
         self,
         func: typing.Callable,
         fullargspec: inspect.FullArgSpec = None,
     ):
         self._func = func
-        self._fullargspec = inspect.getfullargspec(self._func)
-        self._legal_arg_names = set(
-            self._fullargspec.args + self._fullargspec.kwonlyargs
-        )
+        self._fullargspec = argspec = fullargspec or _getfullargspec(self._func)
+
+        # Everything TemplateFunction.__call__ needs from the argspec, derived once
+        # here rather than on every call.
+        self._annotations = argspec.annotations
+        self._defaulted_arg_names = frozenset(
+            argspec.args[len(argspec.args) - len(argspec.defaults or ()) :]
+        ).union(argspec.kwonlydefaults or ())
+        self._legal_arg_names = frozenset(argspec.args + argspec.kwonlyargs)
         self._num_args_to_match = len(self._legal_arg_names)
-        self._parg_types = [
-            self._fullargspec.annotations.get(arg, self)
-            for arg in self._fullargspec.args
-        ]
+        self._parg_names = tuple(argspec.args)
+        self._parg_types = tuple(
+            argspec.annotations.get(arg, self) for arg in argspec.args
+        )
 
     def annotation_keys(self) -> set[str]:
         argspec = self._fullargspec
@@ -237,8 +306,10 @@ class _Template:
 
         # Check the surrounding scope for an object with this name -- if
         # it exists and it's a TemplateFunction, we avoid making a new one.
+        # sys._getframe rather than inspect.stack(), which builds a FrameInfo, source
+        # context included, for every frame on the stack.
         if (
-            template_func := inspect.stack()[1].frame.f_locals.get(name)
+            template_func := sys._getframe(1).f_locals.get(name)
         ) and isinstance(template_func, TemplateFunction):
             template_func.add(func)
             return template_func
@@ -254,7 +325,7 @@ class _Template:
             name = func.__name__
 
             if (
-                template_func := inspect.stack()[1].frame.f_locals.get(name)
+                template_func := sys._getframe(1).f_locals.get(name)
             ) and isinstance(template_func, TemplateFunction):
                 template_func[types] = func
                 return template_func
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import abc
-import annotated_types
 import asyncio
 import dataclasses
 import heapq
@@ -12,6 +11,9 @@ import typing
 
 from . import _base
 
+if typing.TYPE_CHECKING:
+    import annotated_types
+
 
 type Condition = asyncio.Condition | threading.Condition
 type Lock = asyncio.Lock | threading.Lock
@@ -266,23 +268,22 @@ class EnterContext[** Params, Return](
         return self.exit_context_t(semaphore=self.semaphore), self.next_enter_context
 
     def __get__(self, instance: _base.Instance, owner) -> typing.Self:
-        with self.instance_lock:
-            if (enter_context := self.enter_context_by_instance.get(instance)) is None:
-                enter_context = self.enter_context_by_instance[instance] = dataclasses.replace(
-                    self,
-                    semaphore=self.semaphore_t(
-                        additive_increase=self.semaphore.additive_increase,
-                        multiplicative_decrease=self.semaphore.multiplicative_decrease,
-                        max_holders=self.semaphore.max_holders,
-                        max_waiters=self.semaphore.max_waiters,
-                        per_pane=self.semaphore.per_pane,
-                        per_window=self.semaphore.per_window,
-                        value=self.start,
-                        window=self.semaphore.window,
-                    ),
-                    start=self.start,
-                )
+        if (enter_context := self.enter_context_by_instance.get(id(instance))) is not None:
             return enter_context
+        return self.enter_context_by_instance.setdefault_instance(instance, _base.replace(
+            self,
+            semaphore=self.semaphore_t(
+                additive_increase=self.semaphore.additive_increase,
+                multiplicative_decrease=self.semaphore.multiplicative_decrease,
+                max_holders=self.semaphore.max_holders,
+                max_waiters=self.semaphore.max_waiters,
+                per_pane=self.semaphore.per_pane,
+                per_window=self.semaphore.per_window,
+                value=self.start,
+                window=self.semaphore.window,
+            ),
+            start=self.start,
+        ))
 
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
@@ -1,4 +1,5 @@
 import asyncio
+import gc
 import typing
 
 import pytest
@@ -35,6 +36,17 @@ def test_key() -> None:
     assert foo.register_key == (*__name__.split('.'), test_key.__name__, foo.__name__)
 
 
+def test_nested_key() -> None:
+    def foo():
+        @funktools._base.Decorator()
+        def bar():
+            ...
+
+        return bar
+
+    assert foo().register_key == (*__name__.split('.'), test_nested_key.__name__, foo.__name__, 'bar')
+
+
 def test_register() -> None:
     @funktools._base.Decorator()
     def foo():
@@ -44,6 +56,19 @@ def test_register() -> None:
     assert foo.register_key in funktools._base.Decorator.register.links
 
 
+def test_register_does_not_keep_decorated_alive() -> None:
+    @funktools._base.Decorator()
+    def foo():
+        ...
+
+    register_key = foo.register_key
+    del foo
+    gc.collect()
+
+    assert register_key not in funktools._base.Decorator.register.decorateds
+    assert register_key in funktools._base.Decorator.register.links
+
+
 @pytest.mark.asyncio
 async def test_async_method() -> None:
 
@@ -116,3 +141,13 @@ def test_multi_staticmethod() -> None:
             return locals()
 
     assert Foo.bar(42) == {'v': 42}
+
+
+def test_instance_dict_drops_value_of_unreferenceable_instance() -> None:
+    class Foo:
+        __slots__ = ()
+
+    instance_dict = funktools._base.InstanceDict()
+    with pytest.raises(TypeError):
+        instance_dict.setdefault_instance(Foo(), 'value')
+    assert instance_dict == {}
@@ -339,6 +339,20 @@ def test_annotation_log_level_of_name_sets_log_level() -> None:
     assert logger.level == logging.NOTSET
 
 
+def test_annotation_log_level_positional_only_passes_value() -> None:
+    logger = logging.getLogger('test_annotation_log_level_positional_only_passes_value')
+    logger.setLevel(logging.NOTSET)
+
+    @funktools.CLI()
+    def entrypoint(
+        log_level: funktools.CLI.Annotated.log_level(logger) = 'NOTSET', /,
+    ) -> tuple[funktools.CLI.Annotated.LogLevel]:
+        return log_level,
+
+    assert funktools.CLI().run(entrypoint, shlex.split('--log-level INFO')) == ('INFO',)
+    assert logger.level == logging.INFO
+
+
 def test_annotation_verbose_sets_log_level() -> None:
     logger = logging.getLogger('test_annotation_verbose_sets_log_level')
     logger.setLevel(logging.NOTSET)
@@ -477,3 +491,27 @@ def test_var_keyword_args_are_parsed() -> None:
     assert funktools.CLI().run(
         entrypoint, shlex.split('--foo 1 --bar 2 --baz 3')
     ) == {'foo': {'foo': 1, 'bar': 2, 'baz': 3}}
+
+
+def test_annotated_var_keyword_args_are_parsed() -> None:
+
+    @funktools.CLI()
+    def entrypoint(**foo: typing.Annotated[int, 'foo annotation']) -> dict[str, dict[str, int]]:
+        return locals()
+
+    assert funktools.CLI().run(entrypoint, shlex.split('--foo 1 --bar 2')) == {'foo': {'foo': 1, 'bar': 2}}
+
+
+def test_repeated_var_keyword_arg_takes_last_value() -> None:
+
+    @funktools.CLI()
+    def entrypoint(**foo: int) -> dict[str, dict[str, int]]:
+        return locals()
+
+    assert funktools.CLI().run(entrypoint, shlex.split('--foo 1 --bar 2 --foo 3')) == {'foo': {'foo': 3, 'bar': 2}}
+
+
+def test_missing_entrypoint_is_generated_once() -> None:
+    cli = funktools.CLI()
+    decorated = cli.gen_decorated(test_missing_entrypoint_is_generated_once)
+    assert cli.gen_decorated(test_missing_entrypoint_is_generated_once) is decorated
@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import inspect
 import unittest.mock
 
@@ -329,3 +330,75 @@ def test_multi_exceptions_are_saved() -> None:
     with pytest.raises(FooException):
         foo()
     assert call_count == 1
+
+
+def test_multi_keyword_args_are_keyed() -> None:
+    call_count = 0
+
+    @funktools.LRUCache()
+    def foo(*args, **kwargs) -> tuple[tuple, dict]:
+        nonlocal call_count
+        call_count += 1
+        return args, kwargs
+
+    assert foo('a', 1) == (('a', 1), {})
+    assert foo(a=1) == ((), {'a': 1})
+    assert foo(a=1, b=2) == ((), {'a': 1, 'b': 2})
+    assert foo(b=2, a=1) == ((), {'a': 1, 'b': 2})
+    assert call_count == 3
+
+
+def test_multi_hits_do_not_take_lock() -> None:
+    call_count = 0
+
+    @funktools.LRUCache()
+    def foo() -> None:
+        nonlocal call_count
+        call_count += 1
+
+    foo()
+    with foo.enter_context.lock:
+        foo()
+    assert call_count == 1
+
+
+def test_multi_positional_and_keyword_args_share_key() -> None:
+    call_count = 0
+
+    class Foo:
+        @funktools.LRUCache()
+        def foo(self, a: int, b: int, /, c: int) -> int:
+            nonlocal call_count
+            call_count += 1
+            return a + b + c
+
+    foo = Foo()
+    assert foo.foo(1, 2, 3) == 6
+    assert foo.foo(1, 2, c=3) == 6
+    assert foo.foo(1, 3, c=2) == 6
+    assert call_count == 2
+
+
+def test_multi_bad_call_names_decoratee() -> None:
+
+    @funktools.LRUCache()
+    def foo(a: int) -> int:
+        return a
+
+    with pytest.raises(TypeError, match=r'foo\(\) missing 1 required positional argument'):
+        foo()
+
+
+def test_multi_wrapper_is_keyed_by_its_own_parameters() -> None:
+
+    def inner(a: int, b: int) -> int:
+        return a + b
+
+    @functools.wraps(inner)
+    def wrapper(*args: int, **kwargs: int) -> int:
+        return sum(args) + sum(kwargs.values())
+
+    foo = funktools.LRUCache()(wrapper)
+    assert foo(1, 2, 3) == 6
+    assert foo(1, 2) == 3
+    assert foo(1, b=3) == 4
@@ -1,6 +1,11 @@
 import asyncio
+import concurrent.futures
+import datetime
 import inspect
+import sqlite3
 import tempfile
+import threading
+import time
 
 import pytest
 
@@ -226,3 +231,212 @@ def test_multi_staticmethod() -> None:
     assert call_count == 1
 
 
+def test_multi_batches_writes(db_path: str) -> None:
+    call_count = 0
+
+    @funktools.SQLiteCache(batch_size=2, db_path=db_path)
+    def foo(_) -> None:
+        nonlocal call_count
+        call_count += 1
+
+    def n_rows() -> int:
+        with sqlite3.connect(db_path) as connection:
+            return connection.execute(f'SELECT COUNT(*) FROM `{foo.enter_context.table_name}`').fetchone()[0]
+
+    foo(0)
+    assert n_rows() == 0
+    foo(0)
+    assert call_count == 1
+
+    foo(1)
+    assert n_rows() == 2
+
+
+def test_multi_commits_partial_batch_after_duration(db_path: str) -> None:
+
+    @funktools.SQLiteCache(batch_duration=.01, batch_size=2, db_path=db_path)
+    def foo(_) -> None:
+        ...
+
+    def n_rows() -> int:
+        with sqlite3.connect(db_path) as connection:
+            return connection.execute(f'SELECT COUNT(*) FROM `{foo.enter_context.table_name}`').fetchone()[0]
+
+    foo(0)
+    deadline = time.monotonic() + 5.0
+    while n_rows() == 0 and time.monotonic() < deadline:
+        time.sleep(.01)
+    assert n_rows() == 1
+
+
+@pytest.mark.parametrize('batch_size', [1, 2])
+def test_multi_round_trips_non_literal_value(db_path: str, batch_size: int) -> None:
+    call_count = 0
+
+    @funktools.SQLiteCache(batch_size=batch_size, db_path=db_path)
+    def foo() -> datetime.datetime:
+        nonlocal call_count
+        call_count += 1
+        return datetime.datetime(2024, 1, 1)
+
+    assert foo() == datetime.datetime(2024, 1, 1)
+    assert foo() == datetime.datetime(2024, 1, 1)
+    assert call_count == 1
+
+
+def test_multi_keyword_values_are_keyed(db_path: str) -> None:
+    call_count = 0
+
+    @funktools.SQLiteCache(db_path=db_path)
+    def foo(*, a: int, **kwargs: int) -> int:
+        nonlocal call_count
+        call_count += 1
+        return a + sum(kwargs.values())
+
+    assert foo(a=1) == 1
+    assert foo(a=2) == 2
+    assert foo(a=2, b=1) == 3
+    assert foo(a=2, b=2) == 4
+    assert foo(b=2, a=2) == 4
+    assert call_count == 4
+
+
+@pytest.mark.parametrize('with_old_table', [False, True])
+def test_multi_numeric_looking_keys_are_distinct(db_path: str, with_old_table: bool) -> None:
+    call_count = 0
+
+    def foo(key: str) -> str:
+        nonlocal call_count
+        call_count += 1
+        return key
+
+    if with_old_table:
+        # The schema of older versions, whose NUMERIC affinity key column conflates these keys.
+        with sqlite3.connect(db_path) as connection:
+            table_name = '__'.join(funktools._base.Register.Key.of_name(f'{foo.__module__}.{foo.__qualname__}'))
+            connection.execute(f'CREATE TABLE `{table_name}` (key STRING PRIMARY KEY NOT NULL, value STRING NOT NULL)')
+
+    foo = funktools.SQLiteCache(batch_size=1, db_path=db_path, dumps_key=lambda key: key)(foo)
+
+    assert foo('1') == '1'
+    assert foo('01') == '01'
+    assert foo('1.0') == '1.0'
+    assert call_count == 3
+
+
+def test_multi_finished_calls_are_not_pending(db_path: str) -> None:
+
+    @funktools.SQLiteCache(db_path=db_path)
+    def foo(_) -> None:
+        ...
+
+    foo(0)
+    foo(1)
+    assert foo.enter_context.exit_context_by_key == {}
+
+
+def test_multi_herds_only_call_once(db_path: str) -> None:
+    call_count = 0
+    started, release = threading.Event(), threading.Event()
+
+    @funktools.SQLiteCache(db_path=db_path)
+    def foo() -> int:
+        nonlocal call_count
+        call_count += 1
+        started.set()
+        release.wait()
+        return call_count
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        leader = executor.submit(foo)
+        started.wait()
+        followers = [executor.submit(foo) for _ in range(7)]
+        release.set()
+        assert [leader.result(), *(follower.result() for follower in followers)] == [1] * 8
+
+    assert call_count == 1
+    assert foo.enter_context.exit_context_by_key == {}
+
+
+@pytest.mark.asyncio
+async def test_async_herd_after_exception_calls_once_more(db_path: str) -> None:
+    call_count = 0
+    event = asyncio.Event()
+
+    @funktools.SQLiteCache(db_path=db_path)
+    async def foo() -> int:
+        nonlocal call_count
+        call_count += 1
+        if call_count == 1:
+            await event.wait()
+            raise ValueError()
+        # Suspend, so that the other waiters wake while this call is still in flight.
+        await asyncio.sleep(0)
+        return call_count
+
+    futures = [asyncio.get_event_loop().create_task(foo()) for _ in range(5)]
+    # Let every task reach its wait before the first call raises.
+    await asyncio.sleep(0)
+    event.set()
+    results = await asyncio.gather(*futures, return_exceptions=True)
+
+    assert isinstance(results[0], ValueError)
+    assert results[1:] == [2] * 4
+    assert call_count == 2
+    assert foo.enter_context.exit_context_by_key == {}
+
+
+def test_multi_bad_call_names_decoratee(db_path: str) -> None:
+
+    @funktools.SQLiteCache(db_path=db_path)
+    def foo(a: int) -> int:
+        return a
+
+    with pytest.raises(TypeError, match=r'foo\(\) missing 1 required positional argument'):
+        foo()
+
+
+def test_default_db_path_is_in_memory() -> None:
+
+    @funktools.SQLiteCache()
+    def foo() -> None:
+        ...
+
+    assert foo.enter_context.connection.execute('PRAGMA journal_mode').fetchone() == ('memory',)
+
+
+def test_multi_ignores_unversioned_table(db_path: str) -> None:
+    call_count = 0
+
+    def foo(_) -> int:
+        nonlocal call_count
+        call_count += 1
+        return call_count
+
+    # A table as written by versions that stored `repr` text.
+    with sqlite3.connect(db_path) as connection:
+        table_name = '__'.join(funktools._base.Register.Key.of_name(f'{foo.__module__}.{foo.__qualname__}'))
+        connection.execute(f'CREATE TABLE `{table_name}` (key STRING PRIMARY KEY NOT NULL, value STRING NOT NULL)')
+        connection.execute(f'INSERT INTO `{table_name}` VALUES (?, ?)', (repr(((0,), ())), '42'))
+
+    foo = funktools.SQLiteCache(db_path=db_path)(foo)
+    assert foo(0) == 1
+    assert call_count == 1
+
+
+def test_multi_undecodable_value_is_a_miss(db_path: str) -> None:
+    call_count = 0
+
+    @funktools.SQLiteCache(batch_size=1, db_path=db_path)
+    def foo(_) -> int:
+        nonlocal call_count
+        call_count += 1
+        return call_count
+
+    assert foo(0) == 1
+    with sqlite3.connect(db_path) as connection:
+        connection.execute(f'UPDATE `{foo.enter_context.table_name}` SET value = 42')
+
+    assert foo(0) == 2
+    assert foo(0) == 2
+    assert call_count == 2
@@ -245,3 +245,29 @@ def test_method_decorator() -> None:
     assert uut.bar(a="1", b="1") == "60" + "1" + "1"
     assert uut.bar(a=True, b=True) == 70 + True + True
     assert uut.bar(a=True) == 70 + True
+
+
+def test_repeated_calls() -> None:
+    @Template
+    def repeat(a: int):
+        return "int"
+
+    @Template
+    def repeat(a: str):
+        return "str"
+
+    @Template
+    def repeat(a: int, *, b: str):
+        return "int, str"
+
+    for _ in range(2):
+        assert repeat(1) == "int"
+        assert repeat("1") == "str"
+        assert repeat(1, b="1") == "int, str"
+
+    @Template
+    def repeat(a: float):
+        return "float"
+
+    assert repeat(1.0) == "float"
+    assert repeat(1) == "int"